@@ -1,8 +1,9 @@
 import pygame
 import random
 import math
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from sprite_manager import SpriteManager
+from rendering import DrawList, RenderQueue
 
 class Animal:
     """Represents a farm animal that wanders around"""
@@ -16,6 +17,11 @@ class Animal:
         self.animal_type = animal_type
         self.sprite_manager = sprite_manager
         
+        # Resolve the sprite and its atlas region once - the animal type never changes
+        sprite = sprite_manager.get_animal_sprite(animal_type, self.width)
+        self.blit_source = sprite_manager.get_blit_source(f"animal_{animal_type}", sprite)
+        self.scaled_sprite: Optional[pygame.Surface] = None  # sprite for the last zoomed size drawn
+        
         # Movement properties
         self.speed = 0.5  # Slower than player
         self.direction_x = 0
@@ -150,18 +156,27 @@ class Animal:
         self.x = new_x
         self.y = new_y
     
-    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int) -> None:
-        """Draw the animal sprite"""
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
+    def get_screen_rect(self, camera_x: int, camera_y: int, zoom: float = 1.0) -> pygame.Rect:
+        """Get the screen area the animal sprite covers"""
+        return pygame.Rect(int(self.x * zoom) - camera_x, int(self.y * zoom) - camera_y,
+                           int(self.width * zoom), int(self.height * zoom))
+    
+    def get_sort_y(self) -> float:
+        """Depth used to order drawing - the y-coordinate of the animal's feet"""
+        return self.y + self.height
+    
+    def draw(self, draw_list: DrawList, camera_x: int, camera_y: int, zoom: float = 1.0) -> None:
+        """Queue the animal sprite"""
+        screen_rect = self.get_screen_rect(camera_x, camera_y, zoom)
         
-        # Only draw if on screen
-        if (-32 <= screen_x <= 832 and -32 <= screen_y <= 632):
-            # Get the appropriate sprite for this animal
-            animal_sprite = self.sprite_manager.get_animal_sprite(self.animal_type)
-            
-            # Draw the animal sprite
-            screen.blit(animal_sprite, (screen_x, screen_y))
+        # Queue the animal sprite - from the atlas when it is drawn at its packed size
+        source, area = self.blit_source
+        if screen_rect.width != self.width:
+            # Zoomed: the sprite scaled to the zoom level, fetched when the size changes
+            if self.scaled_sprite is None or self.scaled_sprite.get_width() != screen_rect.width:
+                self.scaled_sprite = self.sprite_manager.get_animal_sprite(self.animal_type, screen_rect.width)
+            source, area = self.scaled_sprite, None
+        draw_list.add(source, screen_rect.topleft, area)
     
     def get_interaction_text(self) -> str:
         """Get text for when player interacts with animal"""
@@ -213,15 +228,16 @@ class FarmAnimals:
             sheep_x, sheep_y = tile_to_pixel(26 + (i % 2), 19 + (i // 2))
             self.add_animal(sheep_x, sheep_y, 'sheep', sheep_bounds)
     
-    def update(self, world_map: List[List[str]]) -> None:
-        """Update all animals"""
-        for animal in self.animals:
-            animal.update(world_map)
+    def update(self, world_map: List[List[str]], ticks: int = 1) -> None:
+        """Update all animals, running several simulation ticks when catching up"""
+        for _ in range(ticks):
+            for animal in self.animals:
+                animal.update(world_map)
     
-    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int) -> None:
-        """Draw all animals"""
+    def submit(self, render_queue: RenderQueue) -> None:
+        """Submit all animals to the render queue, which culls and depth-sorts them"""
         for animal in self.animals:
-            animal.draw(screen, camera_x, camera_y)
+            render_queue.submit(animal)
     
     def check_interactions(self, player_x: int, player_y: int, tile_size: int) -> tuple:
         """Check if player is close enough to interact with any animal"""
@@ -0,0 +1,95 @@
+"""
+🧩 Autotiling - Ernie's Adventure
+Picks edge and corner variants for water, mountains and paths from their neighbours
+
+This file contains:
+- Which tiles blend into their surroundings with edge variants
+- 4-neighbour bitmasks for the whole grid, computed once after world generation
+- Recomputing just the masks around an edited tile
+"""
+
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # plain Python fallback below
+
+# Tiles drawn with an edge on every side that doesn't touch the same tile
+AUTOTILE_TILES = {'W', 'M', 'P'}  # water, mountains, paths
+
+# Neighbour bits - a set bit means the neighbour on that side is the same tile
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+ALL_SIDES = NORTH | EAST | SOUTH | WEST  # no edges - the plain tile sprite
+
+# (dx, dy, bit) for each side
+NEIGHBOURS = ((0, -1, NORTH), (1, 0, EAST), (0, 1, SOUTH), (-1, 0, WEST))
+
+
+def compute_bitmasks(grid: List[List[str]]) -> List[List[int]]:
+    """Get the neighbour bitmask of every tile in the grid
+
+    Tiles that aren't autotiled always get ALL_SIDES. The world's border
+    counts as the same tile, so nothing grows an edge against the map edge.
+    """
+    height = len(grid)
+    width = len(grid[0]) if height > 0 else 0
+    if np is None or height == 0:
+        return [[_bitmask(grid, x, y, width, height) for x in range(width)] for y in range(height)]
+
+    tiles = np.array(grid, dtype='U1')
+    padded = np.pad(tiles, 1, mode='edge')
+    masks = np.zeros((height, width), dtype=np.int32)
+    for dx, dy, bit in NEIGHBOURS:
+        neighbours = padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+        masks |= np.where(neighbours == tiles, bit, 0)
+    masks[~np.isin(tiles, list(AUTOTILE_TILES))] = ALL_SIDES
+    return masks.tolist()
+
+
+def _bitmask(grid: List[List[str]], x: int, y: int, width: int, height: int) -> int:
+    """Neighbour bitmask of one tile"""
+    tile = grid[y][x]
+    if tile not in AUTOTILE_TILES:
+        return ALL_SIDES
+    mask = 0
+    for dx, dy, bit in NEIGHBOURS:
+        # Clamp to the map so the border matches the tile at the edge
+        neighbour_x = min(max(x + dx, 0), width - 1)
+        neighbour_y = min(max(y + dy, 0), height - 1)
+        if grid[neighbour_y][neighbour_x] == tile:
+            mask |= bit
+    return mask
+
+
+class AutotileMap:
+    """Neighbour bitmasks for a tile grid, kept up to date as tiles are edited"""
+
+    def __init__(self, grid: List[List[str]]):
+        self.grid = grid
+        self.height = len(grid)
+        self.width = len(grid[0]) if self.height > 0 else 0
+        self.masks: List[List[int]] = []
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recompute every tile's bitmask"""
+        self.masks = compute_bitmasks(self.grid)
+
+    def update_around(self, x: int, y: int) -> List[Tuple[int, int]]:
+        """Recompute the masks of a changed tile and its neighbours
+
+        Returns the tiles whose mask actually changed, so only those need redrawing.
+        """
+        changed = []
+        for dx, dy in ((0, 0), (0, -1), (1, 0), (0, 1), (-1, 0)):
+            tile_x, tile_y = x + dx, y + dy
+            if 0 <= tile_x < self.width and 0 <= tile_y < self.height:
+                mask = _bitmask(self.grid, tile_x, tile_y, self.width, self.height)
+                if mask != self.masks[tile_y][tile_x]:
+                    self.masks[tile_y][tile_x] = mask
+                    changed.append((tile_x, tile_y))
+        return changed
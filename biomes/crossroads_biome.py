@@ -33,6 +33,19 @@ def create_crossroads_section(world: List[List[str]], WORLD_WIDTH: int, WORLD_HE
             if 0 < tx < WORLD_WIDTH-1 and 0 < ty < WORLD_HEIGHT-1:
                 world[ty][tx] = 'H'  # Stable
 
+def get_crossroads_lights():
+    """Return light sources for the crossroads area"""
+    lights = []
+    
+    tavern_hearth = {
+        'x': 61.5, 'y': 52,  # Spilling out of the tavern's front door
+        'radius': 6,
+        'color': (230, 170, 90)  # Warm firelight
+    }
+    lights.append(tavern_hearth)
+    
+    return lights
+
 def get_crossroads_npcs():
     """Return NPCs for the crossroads area"""
     npcs = []
@@ -33,6 +33,19 @@ def create_southern_section(world: List[List[str]], WORLD_WIDTH: int, WORLD_HEIG
             if 0 < forge_x_tile < WORLD_WIDTH-1 and 0 < forge_y_tile < WORLD_HEIGHT-1:
                 world[forge_y_tile][forge_x_tile] = 'H'  # Forge
 
+def get_southern_lights():
+    """Return light sources for the southern village"""
+    lights = []
+    
+    forge_fire = {
+        'x': 40, 'y': 68,  # Middle of the 6x6 forge
+        'radius': 5,
+        'color': (255, 120, 40)  # Hot orange glow
+    }
+    lights.append(forge_fire)
+    
+    return lights
+
 def get_southern_npcs():
     """Return NPCs for the southern village"""
     npcs = []
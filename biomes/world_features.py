@@ -76,7 +76,6 @@ Future additions for world connectivity:
 - Teleportation circles connecting distant areas
 - Ferry system across the main river
 - Merchant caravan routes with moving traders
-- Weather systems affecting all biomes
 - Day/night cycle with different events
 - Seasonal changes across the world
 - Flying mounts to travel quickly between areas
@@ -87,5 +86,4 @@ Future additions for world connectivity:
 - Trade routes with economic simulation
 - Migratory creatures that move seasonally
 - Message system between settlements
-- World map that fills in as you explore
 """ 
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+🏘️ Building Index - Ernie's Adventure
+Finds every building in the world once so nothing has to scan for them per frame
+
+This file contains:
+- Connected-component labeling of 'H' tiles into rectangular buildings
+- O(1) lookup from any tile to the building covering it
+- Incremental relabeling when a tile changes
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class Building:
+    """A rectangular block of 'H' tiles drawn and treated as one structure"""
+
+    def __init__(self, building_id: int, x: int, y: int, width: int, height: int):
+        self.id = building_id
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Size in tiles as (width, height)"""
+        return (self.width, self.height)
+
+    @property
+    def is_large(self) -> bool:
+        """Large buildings are drawn with one big sprite instead of per-tile houses"""
+        return self.width >= 2 and self.height >= 2
+
+    def contains(self, x: int, y: int) -> bool:
+        """Check if a tile is part of this building"""
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+    def __repr__(self) -> str:
+        return f"Building({self.id}, x={self.x}, y={self.y}, {self.width}x{self.height})"
+
+
+class BuildingIndex:
+    """Labels 'H' regions of the world map into rectangles with size metadata"""
+
+    def __init__(self, world_map: List[List[str]], building_tile: str = 'H'):
+        self.world_map = world_map
+        self.building_tile = building_tile
+        self.world_height = len(world_map)
+        self.world_width = len(world_map[0]) if self.world_height > 0 else 0
+        self.buildings: Dict[int, Building] = {}
+        self.tile_owner: List[List[int]] = []
+        self._next_id = 0
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Label every building in the world from scratch"""
+        self.buildings.clear()
+        self.tile_owner = [[-1] * self.world_width for _ in range(self.world_height)]
+        for y in range(self.world_height):
+            row = self.world_map[y]
+            for x in range(self.world_width):
+                if row[x] == self.building_tile and self.tile_owner[y][x] == -1:
+                    self._label_component(x, y)
+
+    def building_at(self, x: int, y: int) -> Optional[Building]:
+        """Return the building covering this tile, if any"""
+        if 0 <= x < self.world_width and 0 <= y < self.world_height:
+            building_id = self.tile_owner[y][x]
+            if building_id != -1:
+                return self.buildings[building_id]
+        return None
+
+    def buildings_in_area(self, start_x: int, start_y: int, end_x: int, end_y: int) -> List[Building]:
+        """Return buildings overlapping the tile area [start, end)"""
+        return [building for building in self.buildings.values()
+                if building.x < end_x and building.x + building.width > start_x and
+                building.y < end_y and building.y + building.height > start_y]
+
+    def update_tile(self, x: int, y: int) -> List[Building]:
+        """Relabel the buildings around a changed tile
+
+        Returns the buildings that were removed so callers can refresh
+        anything that was drawn for them.
+        """
+        removed = []
+        for check_x, check_y in ((x, y), (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            building = self.building_at(check_x, check_y)
+            if building is not None and building.id in self.buildings:
+                removed.append(self._remove(building))
+
+        # Relabel whatever is left of the removed buildings plus the changed tile
+        seeds = [(x, y)]
+        for building in removed:
+            for tile_y in range(building.y, building.y + building.height):
+                for tile_x in range(building.x, building.x + building.width):
+                    seeds.append((tile_x, tile_y))
+        for seed_x, seed_y in seeds:
+            if (self.world_map[seed_y][seed_x] == self.building_tile and
+                    self.tile_owner[seed_y][seed_x] == -1):
+                self._label_component(seed_x, seed_y)
+        return removed
+
+    def _remove(self, building: Building) -> Building:
+        """Drop a building and free its tiles"""
+        del self.buildings[building.id]
+        for tile_y in range(building.y, building.y + building.height):
+            owner_row = self.tile_owner[tile_y]
+            for tile_x in range(building.x, building.x + building.width):
+                owner_row[tile_x] = -1
+        return building
+
+    def _label_component(self, x: int, y: int) -> None:
+        """Flood fill one connected 'H' region and split it into rectangles"""
+        component = set()
+        stack = [(x, y)]
+        while stack:
+            tile_x, tile_y = stack.pop()
+            if (tile_x, tile_y) in component:
+                continue
+            component.add((tile_x, tile_y))
+            for next_x, next_y in ((tile_x + 1, tile_y), (tile_x - 1, tile_y),
+                                   (tile_x, tile_y + 1), (tile_x, tile_y - 1)):
+                if (0 <= next_x < self.world_width and 0 <= next_y < self.world_height and
+                        (next_x, next_y) not in component and
+                        self.world_map[next_y][next_x] == self.building_tile and
+                        self.tile_owner[next_y][next_x] == -1):
+                    stack.append((next_x, next_y))
+
+        # Most components are already perfect rectangles - split the rest greedily,
+        # taking the widest run from the top-left and growing it down while it fits
+        for tile_y, tile_x in sorted((ty, tx) for tx, ty in component):
+            if self.tile_owner[tile_y][tile_x] != -1:
+                continue
+            width = 1
+            while ((tile_x + width, tile_y) in component and
+                   self.tile_owner[tile_y][tile_x + width] == -1):
+                width += 1
+            height = 1
+            while all((column, tile_y + height) in component and
+                      self.tile_owner[tile_y + height][column] == -1
+                      for column in range(tile_x, tile_x + width)):
+                height += 1
+            self._add(tile_x, tile_y, width, height)
+
+    def _add(self, x: int, y: int, width: int, height: int) -> Building:
+        """Register a new rectangular building"""
+        building = Building(self._next_id, x, y, width, height)
+        self._next_id += 1
+        self.buildings[building.id] = building
+        for tile_y in range(y, y + height):
+            owner_row = self.tile_owner[tile_y]
+            for tile_x in range(x, x + width):
+                owner_row[tile_x] = building.id
+        return building
@@ -1,6 +1,8 @@
+import os
 import pygame
 import sys
 import math
+import time
 import random
 import argparse
 from typing import List, Dict, Tuple, Optional
@@ -14,6 +16,16 @@ from sound_manager import SoundManager
 # Import animals
 from animals import FarmAnimals
 
+# Import building index, tile layers and terrain rendering
+from buildings import BuildingIndex
+from tilemap import LayeredTilemap, LAYERS as TILE_LAYERS, ANIMATION_FRAMES
+from autotile import AutotileMap
+from rendering import (
+    DirtyRectTracker, Minimap, TextCache, DialogueBox, DrawList, RenderQueue, ZoomLevel, ZOOM_LEVELS,
+    IntegerUpscaler, TextureBackend, TEXTURES_AVAILABLE, LightSource, get_light_step, ParticleSystem,
+    WEATHER_AVAILABLE, ExplorationMap, WorldMapOverlay, prerender_chunks
+)
+
 # Import biome modules for collaborative development
 from biomes import (
     create_farming_section, create_forest_section, create_lake_section,
@@ -25,9 +37,9 @@ from biomes.farm_biome import get_farm_npcs
 from biomes.lake_biome import get_lake_npcs
 from biomes.forest_biome import get_forest_npcs
 from biomes.mountain_biome import get_mountain_npcs
-from biomes.crossroads_biome import get_crossroads_npcs
+from biomes.crossroads_biome import get_crossroads_npcs, get_crossroads_lights
 from biomes.ruins_biome import get_ruins_npcs
-from biomes.southern_biome import get_southern_npcs
+from biomes.southern_biome import get_southern_npcs, get_southern_lights
 
 # Initialize Pygame
 pygame.init()
@@ -37,8 +49,22 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 TILE_SIZE = 32
 PLAYER_SIZE = 48  # Make Ernie 1.5x larger than tiles!
-HOUSE_SIZE = 5  # Houses are now 5x5 tiles!
 PLAYER_SPEED = 4
+TYPEWRITER_SPEED = 40  # characters per second when typewriter dialogue is on
+FPS = 60  # frame rate cap, and simulation ticks per second
+IDLE_WAIT_MS = 100  # longest idle sleep before the simulation catches up and checks the screen again
+TILE_ANIMATION_FPS = 8  # frame rate of animated water, crops and wells
+DAY_LENGTH = 240  # real seconds in a full day/night cycle
+WINDOW_LIGHT = (200, 170, 90)  # lamplight glowing from house windows at night
+WINDOW_LIGHT_RADIUS = 1.5  # tiles
+
+# Weather in each biome when weather is on - rain everywhere else
+BIOME_WEATHER = {'mountain': 'snow', 'forest': 'leaves'}
+# Movement keys (left, right, up, down) for each player - alone, player one can use either set
+PLAYER_KEYS = ((pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s),
+               (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN))
+FOG_COLOR = (20, 20, 30)  # unexplored tiles on the minimap with fog of war on
+MAX_CATCH_UP_TICKS = FPS * 5  # never simulate more than this many missed ticks at once
 
 # World size - much larger now!
 WORLD_WIDTH = 100  # tiles
@@ -107,6 +133,18 @@ CYAN = (0, 255, 255)
 SANDY = (238, 203, 173)
 PURPLE = (128, 0, 128)
 
+# Minimap colour for each tile type (anything else is drawn as grass)
+MINIMAP_COLORS = {
+    '#': GRAY,
+    'T': DARK_GREEN,
+    'F': DARK_GREEN,
+    'W': BLUE,
+    'M': LIGHT_GRAY,
+    'P': SANDY,
+    'R': DARK_GRAY,
+    'S': DARK_GRAY,
+}
+
 class Player:
     def __init__(self, x: int, y: int, sprite_manager: SpriteManager):
         self.x = x
@@ -114,9 +152,24 @@ class Player:
         self.width = PLAYER_SIZE  # Ernie is bigger!
         self.height = PLAYER_SIZE  # Ernie is bigger!
         self.speed = PLAYER_SPEED
-        self.direction = 'down'
         self.is_moving = False
         self.sprite_manager = sprite_manager
+        self.scaled_sprite: Optional[pygame.Surface] = None  # sprite for the last zoomed size drawn
+        self.direction = 'down'
+        
+    @property
+    def direction(self) -> str:
+        return self._direction
+        
+    @direction.setter
+    def direction(self, direction: str) -> None:
+        # Look the sprite and its atlas region up once per turn, not once per frame
+        if getattr(self, '_direction', None) == direction:
+            return
+        self._direction = direction
+        sprite = self.sprite_manager.get_player_sprite(direction, PLAYER_SIZE)
+        self.blit_source = self.sprite_manager.get_blit_source(f"player_{direction}@{PLAYER_SIZE}", sprite)
+        self.scaled_sprite = None
         
     def move(self, dx: int, dy: int, world_map: List[List[str]]) -> None:
         new_x = self.x + dx
@@ -153,18 +206,61 @@ class Player:
         self.y = new_y
         self.is_moving = True
             
-    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int) -> None:
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
+    def get_screen_rect(self, camera_x: int, camera_y: int, zoom: float = 1.0) -> pygame.Rect:
+        """Get the screen area the player sprite covers"""
+        return pygame.Rect(int(self.x * zoom) - camera_x, int(self.y * zoom) - camera_y,
+                           int(self.width * zoom), int(self.height * zoom))
+        
+    def get_sort_y(self) -> int:
+        """Depth used to order drawing - the y-coordinate of Ernie's feet"""
+        return self.y + self.height
         
-        # Get the appropriate sprite for current direction (now larger!)
-        player_sprite = self.sprite_manager.get_player_sprite(self.direction, PLAYER_SIZE)
+    def draw(self, draw_list: DrawList, camera_x: int, camera_y: int, zoom: float = 1.0) -> None:
+        screen_rect = self.get_screen_rect(camera_x, camera_y, zoom)
         
-        # Draw the larger player sprite
-        screen.blit(player_sprite, (screen_x, screen_y))
+        # Queue the larger player sprite - from the atlas when it is drawn at its packed size
+        source, area = self.blit_source
+        if screen_rect.width != PLAYER_SIZE:
+            # Zoomed: the sprite for this direction scaled to the zoom level, fetched when the size changes
+            if self.scaled_sprite is None or self.scaled_sprite.get_width() != screen_rect.width:
+                self.scaled_sprite = self.sprite_manager.get_player_sprite(self.direction, screen_rect.width)
+            source, area = self.scaled_sprite, None
+        draw_list.add(source, screen_rect.topleft, area)
+
+class Viewport:
+    """One player's part of the screen, with its own camera, draw queue, dialogue and weather"""
+    
+    def __init__(self, player: Player, rect: pygame.Rect, surface: pygame.Surface, render_queue: RenderQueue):
+        self.player = player
+        self.rect = rect  # area of the screen this view covers
+        self.surface = surface  # drawn into as if it were the whole screen
+        self.render_queue = render_queue
+        self.camera_x = 0
+        self.camera_y = 0
+        
+        # This player's conversation, drawn inside their own view
+        self.dialogue_box: Optional[DialogueBox] = None
+        self.dialogue_text = ""
+        self.show_dialogue = False
+        
+        # Weather for the biome this player is in, anchored to this view's camera
+        self.weather_systems: Dict[str, ParticleSystem] = {}
+        self.weather_system: Optional[ParticleSystem] = None
+        self.weather_camera: Optional[Tuple[int, int]] = None
+        
+    @property
+    def has_dialogue(self) -> bool:
+        """Whether a line of dialogue is open in this view"""
+        return bool(self.show_dialogue and self.dialogue_text)
+        
+    @property
+    def view_rect(self) -> pygame.Rect:
+        """The view in its own coordinates, for culling"""
+        return pygame.Rect((0, 0), self.rect.size)
 
 class NPC:
-    def __init__(self, x: int, y: int, name: str, dialogue: List[str], sprite_manager: SpriteManager, npc_type: str = "default"):
+    def __init__(self, x: int, y: int, name: str, dialogue: List[str], sprite_manager: SpriteManager,
+                 npc_type: str = "default", text_cache: Optional[TextCache] = None):
         self.x = x
         self.y = y
         self.width = TILE_SIZE
@@ -176,21 +272,52 @@ class NPC:
         self.sprite_manager = sprite_manager
         self.npc_type = npc_type
         
-    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int) -> None:
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
+        # Resolve the sprite and its atlas region once - the NPC type never changes
+        sprite = sprite_manager.get_npc_sprite(npc_type, TILE_SIZE)
+        self.blit_source = sprite_manager.get_blit_source(f"npc_{npc_type}", sprite)
+        self.scaled_sprite: Optional[pygame.Surface] = None  # sprite for the last zoomed size drawn
+        
+        # Pre-render the name label once instead of every frame
+        if text_cache is not None:
+            self.name_label = text_cache.render(name, 20, WHITE)
+        else:
+            self.name_label = pygame.font.Font(None, 20).render(name, True, WHITE)
+        self.label_width, self.label_height = self.name_label.get_size()
+        
+    def get_sprite_rect(self, camera_x: int, camera_y: int, zoom: float = 1.0) -> pygame.Rect:
+        """Get the screen area covered by the NPC sprite alone"""
+        return pygame.Rect(int(self.x * zoom) - camera_x, int(self.y * zoom) - camera_y,
+                           int(self.width * zoom), int(self.height * zoom))
+        
+    def get_label_rect(self, sprite_rect: pygame.Rect) -> pygame.Rect:
+        """Get the screen area of the name label above an NPC sprite"""
+        label_rect = pygame.Rect(0, 0, self.label_width, self.label_height)
+        label_rect.center = (sprite_rect.centerx, sprite_rect.top - 10)
+        return label_rect
         
-        # Get the appropriate sprite for this NPC type
-        npc_sprite = self.sprite_manager.get_npc_sprite(self.npc_type)
+    def get_screen_rect(self, camera_x: int, camera_y: int, zoom: float = 1.0) -> pygame.Rect:
+        """Get the screen area covered by the NPC sprite and its name label"""
+        sprite_rect = self.get_sprite_rect(camera_x, camera_y, zoom)
+        return sprite_rect.union(self.get_label_rect(sprite_rect))
         
-        # Draw the NPC sprite
-        screen.blit(npc_sprite, (screen_x, screen_y))
+    def get_sort_y(self) -> int:
+        """Depth used to order drawing - the y-coordinate of the NPC's feet"""
+        return self.y + self.height
         
-        # Draw name above NPC
-        font = pygame.font.Font(None, 20)
-        name_text = font.render(self.name, True, WHITE)
-        name_rect = name_text.get_rect(center=(screen_x + self.width//2, screen_y - 10))
-        screen.blit(name_text, name_rect)
+    def draw(self, draw_list: DrawList, camera_x: int, camera_y: int, zoom: float = 1.0) -> None:
+        sprite_rect = self.get_sprite_rect(camera_x, camera_y, zoom)
+        
+        # Queue the NPC sprite - from the atlas when it is drawn at its packed size
+        source, area = self.blit_source
+        if sprite_rect.width != self.width:
+            # Zoomed: the sprite scaled to the zoom level, fetched when the size changes
+            if self.scaled_sprite is None or self.scaled_sprite.get_width() != sprite_rect.width:
+                self.scaled_sprite = self.sprite_manager.get_npc_sprite(self.npc_type, sprite_rect.width)
+            source, area = self.scaled_sprite, None
+        draw_list.add(source, sprite_rect.topleft, area)
+        
+        # Queue name above NPC, on top of every character
+        draw_list.add(self.name_label, self.get_label_rect(sprite_rect).topleft, layer='overhead')
         
     def interact(self) -> str:
         if not self.is_talking:
@@ -213,9 +340,51 @@ class NPC:
         return self.dialogue[self.current_dialogue]
 
 class Game:
-    def __init__(self, spawn_section: str = 'farm'):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Ernie's Adventure")
+    def __init__(self, spawn_section: str = 'farm', dirty_rects: bool = False, scroll_terrain: bool = False,
+                 typewriter: bool = False, atlas: bool = False, idle: bool = False, zoom: float = 1.0,
+                 scale: Optional[int] = None, fullscreen: bool = False, backend: str = 'surface',
+                 day_night: bool = False, hour: float = 12.0, weather: bool = False,
+                 fog_of_war: bool = False, coop: bool = False, prerender_workers: int = 0,
+                 seed: Optional[int] = None):
+        if scale is None:
+            scale = 0 if fullscreen else 1  # fullscreen picks the biggest scale that fits
+        self.backend = None
+        if backend != 'surface' and not TEXTURES_AVAILABLE:
+            print("⚠️  The texture backend needs pygame._sdl2 - drawing with surfaces")
+            backend = 'surface'
+        if backend != 'surface':
+            # Draw with SDL textures instead of Surface blits; the renderer does the scaling to the window
+            if scale <= 0 and not fullscreen:
+                desktop_width, desktop_height = pygame.display.get_desktop_sizes()[0]
+                scale = max(1, min(desktop_width // SCREEN_WIDTH, desktop_height // SCREEN_HEIGHT))
+            self.backend = TextureBackend((SCREEN_WIDTH, SCREEN_HEIGHT), "Ernie's Adventure",
+                                          software=backend == 'texture-software',
+                                          window_size=(SCREEN_WIDTH * max(1, scale), SCREEN_HEIGHT * max(1, scale)),
+                                          fullscreen=fullscreen)
+            self.display = None
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))  # only its size is used; frames live in the renderer
+            self.upscaler = None
+        elif scale == 1 and not fullscreen:
+            # Draw straight into the window
+            self.display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.screen = self.display
+            self.upscaler = None
+        else:
+            # Draw into an 800x600 frame and scale it up by a whole number to fill the window or screen,
+            # so the drawing cost stays the same whatever the display resolution is
+            if fullscreen:
+                self.display = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            else:
+                if scale <= 0:
+                    desktop_width, desktop_height = pygame.display.get_desktop_sizes()[0]
+                    scale = max(1, min(desktop_width // SCREEN_WIDTH, desktop_height // SCREEN_HEIGHT))
+                self.display = pygame.display.set_mode((SCREEN_WIDTH * scale, SCREEN_HEIGHT * scale))
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert(self.display)
+            self.upscaler = IntegerUpscaler(self.screen.get_size(), self.display, scale)
+        if self.backend is None:
+            pygame.display.set_caption("Ernie's Adventure")
+        # Everything is drawn onto the target - the screen surface, or the texture renderer
+        self.target = self.backend or self.screen
         self.clock = pygame.time.Clock()
         
         # Store spawn section
@@ -224,41 +393,155 @@ class Game:
         # Create sprite manager
         self.sprite_manager = SpriteManager()
         self.sprite_manager.preload_common_sprites()
+        if atlas:
+            # Pack all sprites into a few large pages addressed by integer handles
+            self.sprite_manager.build_atlas(PLAYER_SIZE)
+        
+        # Rendered text is cached so labels and HUD lines are only rasterized when they change
+        self.text_cache = TextCache()
         
         # Create sound manager
         self.sound_manager = SoundManager()
         
         # Create world map
-        self.world_map = self.create_world()
+        self.world_map = self.create_world(seed)
+        
+        # Find every building once instead of scanning for houses each frame
+        self.building_index = BuildingIndex(self.world_map)
+        
+        # Trees, crops and docks sit on the ground, and tree tops are drawn over the characters
+        self.tilemap = LayeredTilemap(self.world_map)
+        
+        # Water, mountain and path edges come from neighbour bitmasks worked out once here
+        self.autotile = AutotileMap(self.tilemap.ground)
+        
+        # Lamplit windows and biome lights glow through the night
+        self.lights = self.create_lights()
+        
+        # Split screen draws into two halves of the screen surface, which textures can't be cut into
+        self.coop = coop and self.backend is None
+        if coop and not self.coop:
+            print("⚠️  Split-screen co-op needs the surface backend - playing solo")
+        
+        # Each layer is rendered once into its own chunks per zoom level and reused every frame.
+        # Zoom levels are built the first time they are used, each from its own pre-scaled tile set.
+        # Both halves of a split screen read the same chunks, so the scroll buffer (one camera) is off.
+        self.scroll_terrain = scroll_terrain and not self.coop
+        self.atlas = atlas
+        self.zoom_levels: Dict[float, ZoomLevel] = {}
+        self.zoom = zoom
+        self.zoom_level = self.get_zoom_level(zoom)
+        if prerender_workers > 0:
+            # Render the whole starting level on several processes now rather than chunk by chunk in play
+            start = time.perf_counter()
+            level = self.zoom_level
+            rendered = prerender_chunks(self.world_map, (level.chunk_cache, level.decoration_cache,
+                                                         level.canopy_cache), prerender_workers)
+            print(f"🏭 Pre-rendered {rendered} chunks on {prerender_workers} processes "
+                  f"in {time.perf_counter() - start:.2f}s")
         
         # Create player at specified spawn point
         spawn_x, spawn_y = WORLD_SECTIONS[spawn_section]['spawn']
         self.player = Player(spawn_x * TILE_SIZE + 16, spawn_y * TILE_SIZE + 16, self.sprite_manager)
+        self.players = [self.player]
+        if self.coop:
+            # Player two starts in the same spot and walks off with the arrow keys
+            self.players.append(Player(self.player.x, self.player.y, self.sprite_manager))
         
         # Create NPCs
         self.npcs = self.create_npcs()
         
+        # Tiles the player has seen, one bit each - filled in along the camera's leading edge
+        self.exploration = ExplorationMap(WORLD_WIDTH, WORLD_HEIGHT, FOG_COLOR) if fog_of_war else None
+        
+        # Minimap is rendered once from the tile grid; only markers are drawn per frame
+        self.minimap = Minimap(self.world_map, self.building_index, MINIMAP_COLORS, GREEN, BROWN,
+                               {'border': WHITE, 'player': RED, 'npc': YELLOW, 'animal': WHITE},
+                               exploration=self.exploration)
+        self.minimap_surface = None
+        if self.backend is not None:
+            # Textures can't be drawn on, so the minimap is drawn into its own surface and re-uploaded
+            self.minimap_surface = pygame.Surface((self.minimap.size, self.minimap.size))
+            self.backend.mark_dynamic(self.minimap_surface)
+            if self.exploration is not None:
+                self.exploration.on_mask_changed = self.backend.refresh
+        
+        # The world map is built from the tile grid the first time it is opened and kept until tiles change
+        self.world_map_overlay = WorldMapOverlay(
+            self.world_map, self.building_index, MINIMAP_COLORS, GREEN, BROWN,
+            {'border': WHITE, 'background': BLACK, 'player': RED, 'npc': YELLOW},
+            {section['name']: section['spawn'] for section in WORLD_SECTIONS.values()},
+            self.text_cache, (SCREEN_WIDTH, SCREEN_HEIGHT), exploration=self.exploration, player_colors=(CYAN,))
+        self.show_world_map = False
+        
         # Create farm animals
         self.farm_animals = FarmAnimals(self.sprite_manager)
         if spawn_section == 'farm':  # Only add animals if spawning in farm
             self.farm_animals.create_farm_animals()
         
-        # Camera
+        # Camera - player one's, which the whole-screen effects (dirty rects, idle) follow
         self.camera_x = 0
         self.camera_y = 0
+        self.last_camera = None
+        
+        # Water, crops and wells all show the same frame of their animation, from one clock
+        self.animation_frame = 0
+        
+        # Time of day, from 0 at midnight to 0.5 at noon - it only moves on with the day/night cycle on
+        self.day_night = day_night
+        self.start_time_of_day = (hour / 24) % 1.0
+        self.light_step = get_light_step(self.start_time_of_day)
+        
+        # Rain, snow or leaves depending on each player's biome, each a pool of particles per view
+        # made the first time it is needed
+        self.weather = weather and WEATHER_AVAILABLE
+        if weather and not self.weather:
+            print("⚠️  Weather needs numpy - playing without it")
+        
+        # Idle mode skips drawing and sleeps while nothing on screen changes
+        self.idle = idle
+        self.last_frame_state = None
+        self.sim_start_time = 0
+        self.sim_ticks = 0
+        
+        # Dirty-rect mode only redraws and pushes the parts of the screen that changed
+        # (the texture backend and split screen always redraw the whole frame)
+        self.dirty_rects = (DirtyRectTracker(self.screen.get_rect())
+                            if dirty_rects and self.backend is None and not self.coop else None)
+        
+        # World, characters and HUD text are queued each frame, culled, depth-sorted and submitted in batches
+        self.render_queue = RenderQueue()
+        
+        # One view of the whole screen, or one for each player side by side, each with its own camera.
+        # Every view draws from the same zoom level, so its terrain chunks and sprites are shared.
+        if self.coop:
+            half_width = SCREEN_WIDTH // 2
+            self.viewports = []
+            for index, player in enumerate(self.players):
+                rect = pygame.Rect(index * half_width, 0, half_width, SCREEN_HEIGHT)
+                self.viewports.append(Viewport(player, rect, self.screen.subsurface(rect),
+                                               self.render_queue if index == 0 else RenderQueue()))
+        else:
+            self.viewports = [Viewport(self.player, self.screen.get_rect(), self.target, self.render_queue)]
         
         # UI
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
-        self.dialogue_box = None
-        self.dialogue_text = ""
-        self.show_dialogue = False
+        self.font = self.text_cache.get_font(None, 32)
+        self.small_font = self.text_cache.get_font(None, 24)
+        # Each view has its own dialogue box, so one player's conversation stays on their side of the screen
+        for viewport in self.viewports:
+            viewport.dialogue_box = DialogueBox(pygame.Rect(50, viewport.rect.height - 150, viewport.rect.width - 100, 100),
+                                                self.small_font, WHITE, BLACK, WHITE,
+                                                chars_per_second=TYPEWRITER_SPEED if typewriter else 0)
         
         # Input
         self.keys = {}
         
-    def create_world(self) -> List[List[str]]:
+    @staticmethod
+    def create_world(seed: Optional[int] = None) -> List[List[str]]:
         """Create a large, diverse world map using modular biomes"""
+        if seed is not None:
+            # Seeded right here, so nothing built before the world changes which world a seed gives
+            random.seed(seed)
         world = []
         
         # Initialize with grass
@@ -288,6 +571,30 @@ class Game:
     
 
 
+    def create_lights(self) -> List[LightSource]:
+        """Create light sources for house windows and from modular biome files"""
+        lights = []
+        
+        # A glow in every window of the big houses, and one in the middle of small ones
+        for building in self.building_index.buildings.values():
+            if building.is_large:
+                windows = self.sprite_manager.get_house_windows(building.width * TILE_SIZE,
+                                                                building.height * TILE_SIZE)
+                for window in windows:
+                    lights.append(LightSource(building.x + window.centerx / TILE_SIZE,
+                                              building.y + window.centery / TILE_SIZE,
+                                              WINDOW_LIGHT_RADIUS, WINDOW_LIGHT))
+            else:
+                lights.append(LightSource(building.x + building.width / 2, building.y + building.height / 2,
+                                          WINDOW_LIGHT_RADIUS, WINDOW_LIGHT))
+        
+        # Forge fires, hearths and the like
+        for get_biome_lights in (get_crossroads_lights, get_southern_lights):
+            for light_data in get_biome_lights():
+                lights.append(LightSource(light_data['x'], light_data['y'], light_data['radius'],
+                                          light_data['color']))
+        return lights
+    
     def create_npcs(self) -> List[NPC]:
         """Create NPCs from modular biome files"""
         npcs = []
@@ -315,7 +622,8 @@ class Game:
                     npc_data['name'],
                     npc_data['dialogue'],
                     self.sprite_manager,
-                    npc_type
+                    npc_type,
+                    self.text_cache
                 )
                 npcs.append(npc)
         
@@ -325,7 +633,7 @@ class Game:
             "The roads are safer with companions.",
             "I trade goods between the villages.",
             "Have you seen the beautiful lake to the northeast?"
-        ], self.sprite_manager, "merchant")
+        ], self.sprite_manager, "merchant", self.text_cache)
         npcs.append(traveling_merchant)
         
         return npcs
@@ -343,10 +651,11 @@ class Game:
         else:
             return "default"
     
-    def get_current_biome(self) -> str:
+    def get_current_biome(self, player: Optional[Player] = None) -> str:
         """Determine which biome the player is currently in based on their position"""
-        player_tile_x = self.player.x // TILE_SIZE
-        player_tile_y = self.player.y // TILE_SIZE
+        player = player or self.player
+        player_tile_x = player.x // TILE_SIZE
+        player_tile_y = player.y // TILE_SIZE
         
         # Define biome boundaries based on their general areas
         # Note: Check farm first since it's more specific than forest
@@ -369,312 +678,560 @@ class Game:
         # Default to "wilderness" if not in any specific biome
         return "wilderness"
         
+    def get_biome_label(self, player: Optional[Player] = None) -> Tuple[str, Tuple[int, int, int]]:
+        """Get the display name and HUD colour for the player's current biome"""
+        current_biome = self.get_current_biome(player)
+        if current_biome in WORLD_SECTIONS:
+            return WORLD_SECTIONS[current_biome]['name'], CYAN  # Use cyan color to make it stand out
+        return "Wilderness", LIGHT_GRAY
+        
     def handle_input(self) -> None:
         """Handle player input"""
         keys = pygame.key.get_pressed()
+        if self.coop:
+            for player, key_set in zip(self.players, PLAYER_KEYS):
+                self.move_player(player, keys, (key_set,))
+        else:
+            self.move_player(self.player, keys, PLAYER_KEYS)
+            
+    def move_player(self, player: Player, keys, key_sets) -> None:
+        """Move one player with any of its (left, right, up, down) key sets"""
+        def held(direction: int) -> bool:
+            return any(keys[key_set[direction]] for key_set in key_sets)
         
         # Movement
         dx = 0
         dy = 0
         
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            dx = -self.player.speed
-            self.player.direction = 'left'
-        elif keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            dx = self.player.speed
-            self.player.direction = 'right'
+        if held(0):
+            dx = -player.speed
+            player.direction = 'left'
+        elif held(1):
+            dx = player.speed
+            player.direction = 'right'
             
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            dy = -self.player.speed
-            self.player.direction = 'up'
-        elif keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            dy = self.player.speed
-            self.player.direction = 'down'
+        if held(2):
+            dy = -player.speed
+            player.direction = 'up'
+        elif held(3):
+            dy = player.speed
+            player.direction = 'down'
             
         if dx != 0 or dy != 0:
-            self.player.move(dx, dy, self.world_map)
+            player.move(dx, dy, self.world_map)
         else:
-            self.player.is_moving = False
+            player.is_moving = False
             
-    def check_interactions(self) -> None:
-        """Check for NPC and animal interactions"""
+    def get_interaction_prompt(self, player: Optional[Player] = None) -> str:
+        """Get the interaction prompt for whatever the player is standing next to"""
+        player = player or self.player
+        key_name = "ENTER" if player is not self.player else "SPACE"
+        
         # Check NPCs
         for npc in self.npcs:
-            distance = math.sqrt((self.player.x - npc.x)**2 + (self.player.y - npc.y)**2)
+            distance = math.sqrt((player.x - npc.x)**2 + (player.y - npc.y)**2)
             if distance < TILE_SIZE * 1.5:  # Close enough to interact
-                # Show interaction prompt
-                prompt_text = f"Press SPACE to talk to {npc.name}"
-                prompt_surface = self.small_font.render(prompt_text, True, WHITE)
-                prompt_rect = prompt_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
-                self.screen.blit(prompt_surface, prompt_rect)
-                return
+                return f"Press {key_name} to talk to {npc.name}"
         
         # Check animals if no NPC is nearby
-        animal_interaction_text, animal = self.farm_animals.check_interactions(self.player.x, self.player.y, TILE_SIZE)
+        animal_interaction_text, animal = self.farm_animals.check_interactions(player.x, player.y, TILE_SIZE)
         if animal_interaction_text:
-            prompt_text = f"Press SPACE to interact with {animal_interaction_text.split(':')[0]}"
-            prompt_surface = self.small_font.render(prompt_text, True, WHITE)
-            prompt_rect = prompt_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
-            self.screen.blit(prompt_surface, prompt_rect)
+            return f"Press {key_name} to interact with {animal_interaction_text.split(':')[0]}"
+        return ""
+        
+    def check_interactions(self, viewport: Viewport) -> None:
+        """Check for NPC and animal interactions"""
+        prompt_text = self.get_interaction_prompt(viewport.player)
+        if prompt_text:
+            # Show interaction prompt
+            prompt_surface = self.text_cache.render(prompt_text, 24, WHITE)
+            prompt_rect = prompt_surface.get_rect(center=(viewport.rect.width//2, viewport.rect.height - 50))
+            viewport.render_queue.add(prompt_surface, prompt_rect.topleft, layer='ui')
+                
+    def get_viewport(self, player: Player) -> Viewport:
+        """Get the view that follows a player"""
+        return next(viewport for viewport in self.viewports if viewport.player is player)
                 
-    def handle_interaction(self) -> None:
+    def handle_interaction(self, player: Optional[Player] = None) -> None:
         """Handle space key interaction"""
+        viewport = self.get_viewport(player or self.player)
+        player = viewport.player
+        # Finish writing out the current line before moving on
+        if viewport.has_dialogue and viewport.dialogue_box.is_revealing(viewport.dialogue_text):
+            viewport.dialogue_box.skip_reveal()
+            return
+        
         # First check NPCs
         for npc in self.npcs:
-            distance = math.sqrt((self.player.x - npc.x)**2 + (self.player.y - npc.y)**2)
+            distance = math.sqrt((player.x - npc.x)**2 + (player.y - npc.y)**2)
             if distance < TILE_SIZE * 1.5:
-                if not self.show_dialogue:
-                    self.dialogue_text = npc.interact()
-                    self.show_dialogue = True
+                if not viewport.show_dialogue:
+                    self.open_dialogue(viewport, npc.interact())
                 else:
-                    self.dialogue_text = npc.next_dialogue()
-                    if not self.dialogue_text:
-                        self.show_dialogue = False
+                    text = npc.next_dialogue()
+                    if text:
+                        self.open_dialogue(viewport, text)
+                    else:
+                        self.close_dialogue(viewport)
                 return
         
         # Then check animals if no NPC was interacted with
-        animal_interaction_text, animal = self.farm_animals.check_interactions(self.player.x, self.player.y, TILE_SIZE)
+        animal_interaction_text, animal = self.farm_animals.check_interactions(player.x, player.y, TILE_SIZE)
         if animal_interaction_text:
-            if not self.show_dialogue:
-                self.dialogue_text = animal_interaction_text
-                self.show_dialogue = True
+            if not viewport.show_dialogue:
+                self.open_dialogue(viewport, animal_interaction_text)
                 # Play the animal sound!
                 if animal:
                     animal.play_sound(self.sound_manager)
             else:
-                self.show_dialogue = False
+                self.close_dialogue(viewport)
                 
+    def open_dialogue(self, viewport: Viewport, text: str) -> None:
+        """Show a line of dialogue in a view, typed out from the start"""
+        viewport.dialogue_text = text
+        viewport.show_dialogue = True
+        viewport.dialogue_box.start(text)
+                
+    def close_dialogue(self, viewport: Viewport) -> None:
+        """Close a view's dialogue box"""
+        viewport.show_dialogue = False
+        viewport.dialogue_box.stop()
+                
+    def get_zoom_level(self, zoom: float) -> ZoomLevel:
+        """Get the terrain caches for a zoom factor, building them the first time"""
+        level = self.zoom_levels.get(zoom)
+        if level is None:
+            level = ZoomLevel(zoom, self.tilemap, self.sprite_manager, self.building_index, TILE_SIZE,
+                              scroll_view_size=self.screen.get_size() if self.scroll_terrain else None,
+                              atlas=self.atlas and zoom == 1.0, autotile=self.autotile, lights=self.lights)
+            if self.backend is not None:
+                # The scroll buffer is scrolled and drawn into in place, so upload it again each frame,
+                # and chunks are uploaded again after their animated tiles are redrawn
+                if level.scroll_buffer is not None:
+                    self.backend.mark_dynamic(level.scroll_buffer.surface)
+                for cache in (level.chunk_cache, level.decoration_cache, level.canopy_cache):
+                    cache.on_chunk_changed = self.backend.refresh
+            self.zoom_levels[zoom] = level
+        return level
+        
+    def set_zoom(self, zoom: float) -> None:
+        """Switch the camera to another zoom factor"""
+        if zoom == self.zoom:
+            return
+        self.zoom = zoom
+        self.zoom_level = self.get_zoom_level(zoom)
+        self.update_camera()
+        if self.dirty_rects is not None:
+            self.dirty_rects.invalidate_all()
+        
+    def change_zoom(self, steps: int) -> None:
+        """Zoom in (positive steps) or out (negative steps) through ZOOM_LEVELS"""
+        index = ZOOM_LEVELS.index(self.zoom) if self.zoom in ZOOM_LEVELS else ZOOM_LEVELS.index(1.0)
+        index = max(0, min(len(ZOOM_LEVELS) - 1, index + steps))
+        self.set_zoom(ZOOM_LEVELS[index])
+        
     def update_camera(self) -> None:
-        """Update camera to follow player"""
-        self.camera_x = self.player.x - SCREEN_WIDTH // 2
-        self.camera_y = self.player.y - SCREEN_HEIGHT // 2
-        
-        # Keep camera in bounds of the larger world
-        self.camera_x = max(0, min(self.camera_x, WORLD_WIDTH * TILE_SIZE - SCREEN_WIDTH))
-        self.camera_y = max(0, min(self.camera_y, WORLD_HEIGHT * TILE_SIZE - SCREEN_HEIGHT))
-        
-    def _find_house_top_left(self, x: int, y: int) -> tuple:
-        """Find the top-left corner of the 5x5 house that contains this tile"""
-        # Check a 5x5 area around this tile to find the house boundaries
-        for check_y in range(max(0, y - 4), min(WORLD_HEIGHT - 4, y + 1)):
-            for check_x in range(max(0, x - 4), min(WORLD_WIDTH - 4, x + 1)):
-                # Check if this could be a top-left corner of a 5x5 house
-                if self._is_complete_house_at(check_x, check_y):
-                    return (check_x, check_y)
-        return None
-    
-    def _is_complete_house_at(self, x: int, y: int) -> bool:
-        """Check if there's a complete 5x5 house starting at this position"""
-        if x + HOUSE_SIZE > WORLD_WIDTH or y + HOUSE_SIZE > WORLD_HEIGHT:
-            return False
+        """Update camera to follow player
+        
+        The camera is in zoomed pixels: a world pixel p is drawn at p * zoom - camera.
+        """
+        tile_size = self.zoom_level.tile_size
+        for index, viewport in enumerate(self.viewports):
+            view_width, view_height = viewport.rect.size
+            camera_x = int(viewport.player.x * self.zoom) - view_width // 2
+            camera_y = int(viewport.player.y * self.zoom) - view_height // 2
+            
+            # Keep camera in bounds of the larger world
+            viewport.camera_x = max(0, min(camera_x, WORLD_WIDTH * tile_size - view_width))
+            viewport.camera_y = max(0, min(camera_y, WORLD_HEIGHT * tile_size - view_height))
             
-        # Check if all tiles in 5x5 area are house tiles
-        for house_y in range(y, y + HOUSE_SIZE):
-            for house_x in range(x, x + HOUSE_SIZE):
-                if self.world_map[house_y][house_x] != 'H':
-                    return False
-        return True
+            if self.exploration is not None:
+                # Everything in view counts as seen; only tiles that just scrolled in are new
+                first_x, first_y = viewport.camera_x // tile_size, viewport.camera_y // tile_size
+                last_x = (viewport.camera_x + view_width - 1) // tile_size
+                last_y = (viewport.camera_y + view_height - 1) // tile_size
+                self.exploration.update(pygame.Rect(first_x, first_y, last_x - first_x + 1, last_y - first_y + 1),
+                                        viewer=index)
+        self.camera_x = self.viewports[0].camera_x
+        self.camera_y = self.viewports[0].camera_y
+        
+    def set_tile(self, x: int, y: int, tile: str) -> None:
+        """Change a single world tile and refresh any cached terrain around it"""
+        old_tile = self.world_map[y][x]
+        if old_tile == tile:
+            return
+        self.world_map[y][x] = tile
+        
+        # Only re-render the layers whose tile actually changed
+        old_layers = {layer: self.tilemap.get_layer(layer)[y][x] for layer in TILE_LAYERS}
+        self.tilemap.update_tile(x, y)
+        changed_layers = [layer for layer in TILE_LAYERS if self.tilemap.get_layer(layer)[y][x] != old_layers[layer]]
+        for level in self.zoom_levels.values():
+            level.update_tile(x, y)
+            level.invalidate_area(x, y, x + 1, y + 1, changed_layers)
+        
+        # Neighbours whose edges changed because of this tile
+        for tile_x, tile_y in self.autotile.update_around(x, y):
+            for level in self.zoom_levels.values():
+                level.invalidate_area(tile_x, tile_y, tile_x + 1, tile_y + 1, ['ground'])
+        
+        changed_areas = [(x, y, x + 1, y + 1)]
+        if 'H' in (old_tile, tile):
+            # Buildings are drawn as one sprite, so refresh everything the old and new buildings cover
+            affected = self.building_index.update_tile(x, y)
+            building = self.building_index.building_at(x, y)
+            if building is not None:
+                affected.append(building)
+            for building in affected:
+                changed_areas.append((building.x, building.y,
+                                      building.x + building.width, building.y + building.height))
+            
+            # The buildings' windows moved with them
+            self.lights = self.create_lights()
+            for level in self.zoom_levels.values():
+                level.lightmaps.set_lights(self.lights)
+        
+        self.world_map_overlay.invalidate()
+        for area in changed_areas:
+            self.minimap.update_area(*area)
+            for level in self.zoom_levels.values():
+                level.invalidate_area(*area, ['ground'])
+        if self.dirty_rects is not None:
+            self.dirty_rects.invalidate_all()
+        self.last_frame_state = None
     
-    def draw_world(self) -> None:
-        """Draw the world map with all new tile types"""
-        start_x = max(0, self.camera_x // TILE_SIZE - 1)
-        end_x = min(WORLD_WIDTH, (self.camera_x + SCREEN_WIDTH) // TILE_SIZE + 2)
-        start_y = max(0, self.camera_y // TILE_SIZE - 1)
-        end_y = min(WORLD_HEIGHT, (self.camera_y + SCREEN_HEIGHT) // TILE_SIZE + 2)
-        
-        # Keep track of which house tiles we've already drawn as part of large houses
-        drawn_house_tiles = set()
-        
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile = self.world_map[y][x]
-                screen_x = x * TILE_SIZE - self.camera_x
-                screen_y = y * TILE_SIZE - self.camera_y
-                
-                # Special handling for houses - draw as large 5x5 sprites
-                if tile == 'H':
-                    # Skip if this tile is already part of a drawn house
-                    if (x, y) in drawn_house_tiles:
-                        continue
-                        
-                    # Find the top-left corner of the house this tile belongs to
-                    house_top_left = self._find_house_top_left(x, y)
+    def draw_world(self, viewport: Viewport) -> None:
+        """Queue the world map's layers at the current zoom level"""
+        self.zoom_level.set_animation_frame(self.animation_frame)
+        self.zoom_level.set_light_step(self.light_step)
+        self.zoom_level.submit(viewport.render_queue, viewport.camera_x, viewport.camera_y)
                     
-                    if house_top_left:
-                        house_x, house_y = house_top_left
-                        # Draw a large house sprite (5x5 tiles = 160x160 pixels)
-                        large_house_sprite = self.sprite_manager.get_tile_sprite('H', HOUSE_SIZE * TILE_SIZE)
-                        house_screen_x = house_x * TILE_SIZE - self.camera_x
-                        house_screen_y = house_y * TILE_SIZE - self.camera_y
-                        self.screen.blit(large_house_sprite, (house_screen_x, house_screen_y))
-                        
-                        # Mark all tiles in this house as drawn
-                        for house_tile_y in range(house_y, house_y + HOUSE_SIZE):
-                            for house_tile_x in range(house_x, house_x + HOUSE_SIZE):
-                                drawn_house_tiles.add((house_tile_x, house_tile_y))
-                    else:
-                        # This is a single house tile or part of a broken house structure
-                        # Draw grass background first, then small house sprite
-                        grass_sprite = self.sprite_manager.get_tile_sprite('.')
-                        self.screen.blit(grass_sprite, (screen_x, screen_y))
-                        
-                        house_sprite = self.sprite_manager.get_tile_sprite('H')
-                        self.screen.blit(house_sprite, (screen_x, screen_y))
-                else:
-                    # Regular tile handling
-                    tile_sprite = self.sprite_manager.get_tile_sprite(tile)
-                    self.screen.blit(tile_sprite, (screen_x, screen_y))
-                    
-    def draw_ui(self) -> None:
-        """Draw UI elements with spawn section info"""
-        # Title with current section
-        section_info = WORLD_SECTIONS[self.spawn_section]
-        title_text = f"Ernie's Adventure - {section_info['name']}"
-        title_surface = self.font.render(title_text, True, WHITE)
-        self.screen.blit(title_surface, (10, 10))
+    def draw_ui(self, viewport: Viewport) -> None:
+        """Queue the HUD text with spawn section info on the UI layer"""
+        render_queue = viewport.render_queue
+        if self.coop:
+            # Half a screen only has room for which player this is and their own keys
+            number = self.players.index(viewport.player) + 1
+            title_text = f"Player {number}"
+            controls = "WASD: Move | SPACE: Interact" if number == 1 else "Arrows: Move | ENTER: Interact"
+        else:
+            # Title with current section
+            section_info = WORLD_SECTIONS[self.spawn_section]
+            title_text = f"Ernie's Adventure - {section_info['name']}"
+            controls = "WASD: Move | SPACE: Interact | +/- Volume | [ ]: Zoom | M: Map"
+        title_surface = self.text_cache.render(title_text, 32, WHITE)
+        render_queue.add(title_surface, (10, 10), layer='ui')
         
         # Controls
-        controls_text = self.small_font.render("WASD: Move | SPACE: Interact | +/- Volume", True, WHITE)
-        self.screen.blit(controls_text, (10, 40))
+        controls_text = self.text_cache.render(controls, 24, WHITE)
+        render_queue.add(controls_text, (10, 40), layer='ui')
         
         # World coordinates
-        world_x = self.player.x // TILE_SIZE
-        world_y = self.player.y // TILE_SIZE
-        pos_text = self.small_font.render(f"Location: ({world_x}, {world_y})", True, WHITE)
-        self.screen.blit(pos_text, (10, 70))
+        world_x = viewport.player.x // TILE_SIZE
+        world_y = viewport.player.y // TILE_SIZE
+        pos_text = self.text_cache.render(f"Location: ({world_x}, {world_y})", 24, WHITE)
+        render_queue.add(pos_text, (10, 70), layer='ui')
         
         # Current biome
-        current_biome = self.get_current_biome()
-        if current_biome in WORLD_SECTIONS:
-            biome_name = WORLD_SECTIONS[current_biome]['name']
-            biome_color = CYAN  # Use cyan color to make it stand out
-        else:
-            biome_name = "Wilderness"
-            biome_color = LIGHT_GRAY
+        biome_name, biome_color = self.get_biome_label(viewport.player)
+        biome_text = self.text_cache.render(f"Biome: {biome_name}", 24, biome_color)
+        render_queue.add(biome_text, (10, 90), layer='ui')
+    
+    def draw_minimap(self, viewport: Viewport) -> None:
+        """Draw a small minimap in the corner"""
+        minimap_x = viewport.rect.width - self.minimap.size - 10
+        minimap_y = 10
         
-        biome_text = self.small_font.render(f"Biome: {biome_name}", True, biome_color)
-        self.screen.blit(biome_text, (10, 90))
+        # Skip the minimap when it is outside the area being redrawn
+        if not viewport.surface.get_clip().colliderect((minimap_x, minimap_y, self.minimap.size, self.minimap.size)):
+            return
         
-        # Draw minimap
-        self.draw_minimap()
-        
-        # Dialogue box
-        if self.show_dialogue and self.dialogue_text:
-            # Draw dialogue background
-            dialogue_rect = pygame.Rect(50, SCREEN_HEIGHT - 150, SCREEN_WIDTH - 100, 100)
-            pygame.draw.rect(self.screen, BLACK, dialogue_rect)
-            pygame.draw.rect(self.screen, WHITE, dialogue_rect, 3)
-            
-            # Draw dialogue text (handle text wrapping)
-            words = self.dialogue_text.split(' ')
-            lines = []
-            current_line = ""
+        player_tile = (viewport.player.x // TILE_SIZE, viewport.player.y // TILE_SIZE)
+        npc_tiles = ((npc.x // TILE_SIZE, npc.y // TILE_SIZE) for npc in self.npcs)
+        animal_tiles = ((int(animal.x) // TILE_SIZE, int(animal.y) // TILE_SIZE) for animal in self.farm_animals.animals)
+        if self.minimap_surface is not None:
+            self.minimap.draw(self.minimap_surface, 0, 0, player_tile, npc_tiles, animal_tiles)
+            viewport.surface.blit(self.minimap_surface, (minimap_x, minimap_y))
+        else:
+            self.minimap.draw(viewport.surface, minimap_x, minimap_y, player_tile, npc_tiles, animal_tiles)
             
-            for word in words:
-                test_line = current_line + word + " "
-                if self.small_font.size(test_line)[0] < SCREEN_WIDTH - 120:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line.strip())
-                    current_line = word + " "
+    def draw_world_map(self) -> None:
+        """Draw the full-screen world map with every player and the NPCs on it"""
+        if not self.target.get_clip().colliderect(self.world_map_overlay.rect):
+            return
+        player_tiles = [(player.x // TILE_SIZE, player.y // TILE_SIZE) for player in self.players]
+        npc_tiles = ((npc.x // TILE_SIZE, npc.y // TILE_SIZE) for npc in self.npcs)
+        self.world_map_overlay.draw(self.target, player_tiles, npc_tiles)
             
-            if current_line:
-                lines.append(current_line.strip())
+    def draw_view(self, viewport: Viewport) -> None:
+        """Draw the world, characters and HUD as one player sees them"""
+        render_queue = viewport.render_queue
+        render_queue.begin(viewport.surface, viewport.camera_x, viewport.camera_y, self.zoom)
+        
+        # Queue world
+        self.draw_world(viewport)
+        
+        # Submit characters - off-screen ones are culled, the rest drawn back to front by foot position
+        self.farm_animals.submit(render_queue)
+        for npc in self.npcs:
+            render_queue.submit(npc)
+        for player in self.players:
+            render_queue.submit(player)
+        
+        # Weather falls over the characters and tree tops, under the night lighting
+        if viewport.weather_system is not None:
+            viewport.weather_system.submit(render_queue)
             
-            # Draw each line
-            for i, line in enumerate(lines[:3]):  # Max 3 lines
-                line_surface = self.small_font.render(line, True, WHITE)
-                line_y = SCREEN_HEIGHT - 130 + i * 25
-                self.screen.blit(line_surface, (70, line_y))
-    
-    def draw_minimap(self) -> None:
-        """Draw a small minimap in the corner"""
-        minimap_size = 120
-        minimap_scale = 3  # 3x3 tiles per pixel
-        minimap_x = SCREEN_WIDTH - minimap_size - 10
-        minimap_y = 10
+        # Check for interactions
+        self.check_interactions(viewport)
         
-        # Draw minimap background
-        pygame.draw.rect(self.screen, BLACK, (minimap_x, minimap_y, minimap_size, minimap_size))
-        pygame.draw.rect(self.screen, WHITE, (minimap_x, minimap_y, minimap_size, minimap_size), 2)
+        # Queue HUD text
+        self.draw_ui(viewport)
         
-        # Calculate what area of the world to show
-        player_world_x = self.player.x // TILE_SIZE
-        player_world_y = self.player.y // TILE_SIZE
+        # Blit the ground, characters, overhead labels and HUD text, one blits call per layer
+        render_queue.flush(viewport.surface)
         
-        # Center minimap on player
-        map_half = minimap_size // 2 // minimap_scale
-        start_x = max(0, min(WORLD_WIDTH - minimap_size // minimap_scale, player_world_x - map_half))
-        start_y = max(0, min(WORLD_HEIGHT - minimap_size // minimap_scale, player_world_y - map_half))
+        # Draw minimap
+        self.draw_minimap(viewport)
         
-        # Draw minimap tiles
-        for y in range(minimap_size // minimap_scale):
-            for x in range(minimap_size // minimap_scale):
-                world_x = start_x + x
-                world_y = start_y + y
-                
-                if 0 <= world_x < WORLD_WIDTH and 0 <= world_y < WORLD_HEIGHT:
-                    tile = self.world_map[world_y][world_x]
-                    
-                    # Choose color based on tile type
-                    color = GREEN  # Default grass
-                    if tile == '#':
-                        color = GRAY
-                    elif tile in ['T', 'F']:
-                        color = DARK_GREEN
-                    elif tile == 'W':
-                        color = BLUE
-                    elif tile == 'M':
-                        color = LIGHT_GRAY
-                    elif tile == 'P':
-                        color = SANDY
-                    elif tile == 'H':
-                        color = BROWN
-                    elif tile in ['R', 'S']:
-                        color = DARK_GRAY
-                    
-                    pygame.draw.rect(self.screen, color, 
-                                   (minimap_x + x * minimap_scale, 
-                                    minimap_y + y * minimap_scale, 
-                                    minimap_scale, minimap_scale))
+        # Dialogue box, inside this player's view
+        if viewport.has_dialogue:
+            viewport.dialogue_box.draw(viewport.surface, viewport.dialogue_text)
+        
+    def draw_frame(self) -> None:
+        """Draw the world, characters and UI onto the screen"""
+        # Clear screen
+        self.target.fill(BLACK)
         
-        # Draw player position on minimap
-        player_mini_x = minimap_x + (player_world_x - start_x) * minimap_scale
-        player_mini_y = minimap_y + (player_world_y - start_y) * minimap_scale
-        pygame.draw.rect(self.screen, RED, (player_mini_x, player_mini_y, minimap_scale, minimap_scale))
+        # Each player's view, clipped to its own part of the screen
+        for viewport in self.viewports:
+            self.draw_view(viewport)
+        if self.coop:
+            pygame.draw.line(self.target, BLACK, (SCREEN_WIDTH // 2, 0), (SCREEN_WIDTH // 2, SCREEN_HEIGHT), 3)
         
-        # Draw NPCs on minimap
+        # World map over everything else
+        if self.show_world_map:
+            self.draw_world_map()
+        
+    def track_dirty_rects(self) -> None:
+        """Report the screen area and visible state of everything drawn this frame"""
+        tracker = self.dirty_rects
+        screen_rect = self.screen.get_rect()
+        
+        # Any camera movement shifts the whole world, so redraw everything
+        camera = (self.camera_x, self.camera_y, self.zoom)
+        if camera != self.last_camera:
+            tracker.invalidate_all()
+            self.last_camera = camera
+        
+        # Characters
+        tracker.track('player', self.player.get_screen_rect(self.camera_x, self.camera_y, self.zoom), self.player.direction)
         for npc in self.npcs:
-            npc_world_x = npc.x // TILE_SIZE
-            npc_world_y = npc.y // TILE_SIZE
+            npc_rect = npc.get_screen_rect(self.camera_x, self.camera_y, self.zoom)
+            if npc_rect.colliderect(screen_rect):
+                tracker.track(npc, npc_rect)
+        for animal in self.farm_animals.animals:
+            animal_rect = animal.get_screen_rect(self.camera_x, self.camera_y, self.zoom)
+            if animal_rect.colliderect(screen_rect):
+                tracker.track(animal, animal_rect)
+        
+        # HUD text that can change from frame to frame
+        world_x = self.player.x // TILE_SIZE
+        world_y = self.player.y // TILE_SIZE
+        pos_text = f"Location: ({world_x}, {world_y})"
+        tracker.track('hud_location', pygame.Rect((10, 70), self.small_font.size(pos_text)), pos_text)
+        biome_text = f"Biome: {self.get_biome_label()[0]}"
+        tracker.track('hud_biome', pygame.Rect((10, 90), self.small_font.size(biome_text)), biome_text)
+        
+        # Weather particles move all over the view every tick
+        viewport = self.viewports[0]
+        if viewport.weather_system is not None:
+            tracker.track('weather', screen_rect, viewport.weather_system.ticks)
+        
+        # Night falls in a few steps, each darkening the whole view
+        tracker.track('lighting', screen_rect, self.light_step)
+        
+        # Animated tiles change the terrain under the whole view at the animation frame rate
+        if self.zoom_level.animating:
+            tracker.track('tile_animation', screen_rect, self.animation_frame)
+        
+        # Minimap only changes when the player or an animal moves to another tile
+        animal_tiles = tuple((int(animal.x) // TILE_SIZE, int(animal.y) // TILE_SIZE) for animal in self.farm_animals.animals)
+        minimap_rect = pygame.Rect(SCREEN_WIDTH - self.minimap.size - 10, 10, self.minimap.size, self.minimap.size)
+        revealed = self.exploration.revealed if self.exploration is not None else 0
+        tracker.track('minimap', minimap_rect, (world_x, world_y, animal_tiles, revealed))
+        
+        # Interaction prompt and dialogue box
+        prompt_text = self.get_interaction_prompt()
+        if prompt_text:
+            prompt_rect = pygame.Rect((0, 0), self.small_font.size(prompt_text))
+            prompt_rect.center = (SCREEN_WIDTH//2, SCREEN_HEIGHT - 50)
+            tracker.track('prompt', prompt_rect, prompt_text)
+        if viewport.has_dialogue:
+            revealed = viewport.dialogue_box.get_revealed_chars(viewport.dialogue_text)
+            tracker.track('dialogue', viewport.dialogue_box.rect, (viewport.dialogue_text, revealed))
+        
+        # World map shows the player's tile and fills in with the fog
+        if self.show_world_map:
+            explored = self.exploration.revealed if self.exploration is not None else 0
+            tracker.track('world_map', self.world_map_overlay.rect, (world_x, world_y, explored))
+        
+    def present_dirty_rects(self) -> None:
+        """Redraw only the changed parts of the screen and push just those to the display"""
+        self.track_dirty_rects()
+        dirty = self.dirty_rects.collect()
+        
+        if dirty is None:
+            self.draw_frame()
+            self.present_frame()
+        elif dirty:
+            for rect in dirty:
+                self.screen.set_clip(rect)
+                self.draw_frame()
+            self.screen.set_clip(None)
+            self.present_frame(dirty)
+            
+    def present_frame(self, rects: Optional[List[pygame.Rect]] = None) -> None:
+        """Push the drawn frame to the display - all of it, or just the given rectangles"""
+        if self.backend is not None:
+            self.backend.present()
+        elif rects is None:
+            if self.upscaler is not None:
+                self.upscaler.present(self.screen)
+            pygame.display.flip()
+        else:
+            if self.upscaler is not None:
+                rects = self.upscaler.present_rects(self.screen, rects)
+            pygame.display.update(rects)
             
-            if (start_x <= npc_world_x < start_x + minimap_size // minimap_scale and
-                start_y <= npc_world_y < start_y + minimap_size // minimap_scale):
-                npc_mini_x = minimap_x + (npc_world_x - start_x) * minimap_scale
-                npc_mini_y = minimap_y + (npc_world_y - start_y) * minimap_scale
-                pygame.draw.circle(self.screen, YELLOW, 
-                                 (npc_mini_x + minimap_scale//2, npc_mini_y + minimap_scale//2), 2)
+    def get_frame_state(self) -> tuple:
+        """Everything that decides what is on screen, to spot frames identical to the last one drawn"""
+        visible_animals = tuple((int(animal.x), int(animal.y)) for animal in self.farm_animals.animals
+                                if self.is_in_view(animal))
+        animation_frame = self.animation_frame if self.zoom_level.animating else None
+        views = tuple((viewport.camera_x, viewport.camera_y, viewport.player.x, viewport.player.y,
+                       viewport.player.direction, self.get_interaction_prompt(viewport.player),
+                       viewport.weather_system.ticks if viewport.weather_system is not None else None,
+                       viewport.show_dialogue, viewport.dialogue_text,
+                       viewport.dialogue_box.get_revealed_chars(viewport.dialogue_text) if viewport.has_dialogue else 0)
+                      for viewport in self.viewports)
+        return (views, self.zoom, visible_animals, animation_frame, self.light_step, self.show_world_map)
+    
+    def is_in_view(self, drawable) -> bool:
+        """Check if something is on screen in any player's view"""
+        return any(drawable.get_screen_rect(viewport.camera_x, viewport.camera_y, self.zoom).colliderect(viewport.view_rect)
+                   for viewport in self.viewports)
+    
+    def is_animating(self) -> bool:
+        """Check if anything on screen is part-way through moving, so sleeping would make it stutter"""
+        if any(viewport.weather_system is not None for viewport in self.viewports):
+            return True  # weather never stops falling
+        for animal in self.farm_animals.animals:
+            if not animal.is_resting and (animal.direction_x or animal.direction_y) and self.is_in_view(animal):
+                return True
+        return any(viewport.has_dialogue and viewport.dialogue_box.is_revealing(viewport.dialogue_text)
+                   for viewport in self.viewports)
+    
+    def get_animation_frame(self) -> int:
+        """Frame of the tile animations right now, from the shared animation clock"""
+        return pygame.time.get_ticks() * TILE_ANIMATION_FPS // 1000 % ANIMATION_FRAMES
+    
+    def update_weather(self, ticks: int = 1) -> None:
+        """Move each view's weather particles for the biome its player is in"""
+        for viewport in self.viewports:
+            kind = BIOME_WEATHER.get(self.get_current_biome(viewport.player), 'rain')
+            system = viewport.weather_systems.get(kind)
+            if system is None:
+                system = ParticleSystem(kind, viewport.rect.size)
+                viewport.weather_systems[kind] = system
             
+            # Shift the particles against the view's camera so they fall through the world, not across the screen
+            camera = (viewport.camera_x, viewport.camera_y)
+            if system is viewport.weather_system and viewport.weather_camera is not None:
+                system.update(ticks, camera[0] - viewport.weather_camera[0], camera[1] - viewport.weather_camera[1])
+            else:
+                system.update(ticks)
+            viewport.weather_system = system
+            viewport.weather_camera = camera
+    
+    def get_time_of_day(self) -> float:
+        """Time of day from 0 to 1 (0 is midnight, 0.5 is noon), moving on in real time with the cycle on"""
+        if not self.day_night:
+            return self.start_time_of_day
+        return (self.start_time_of_day + pygame.time.get_ticks() / (DAY_LENGTH * 1000)) % 1.0
+    
+    def get_idle_wait(self) -> int:
+        """How long idle mode can sleep - no later than the next tile animation frame if one is in view"""
+        if not self.zoom_level.animating:
+            return IDLE_WAIT_MS
+        frame_ms = 1000 // TILE_ANIMATION_FPS
+        return max(1, min(IDLE_WAIT_MS, frame_ms - pygame.time.get_ticks() % frame_ms))
+    
+    def get_simulation_ticks(self) -> int:
+        """How many simulation ticks are due since the last update, based on real time"""
+        target = (pygame.time.get_ticks() - self.sim_start_time) * FPS // 1000
+        ticks = target - self.sim_ticks
+        if ticks > MAX_CATCH_UP_TICKS:
+            # Don't try to replay a very long stall tick by tick
+            ticks = MAX_CATCH_UP_TICKS
+        self.sim_ticks = target
+        return ticks
+        
+    def benchmark(self, frames: int) -> float:
+        """Draw and present frames as fast as possible and return the average milliseconds per frame"""
+        # One frame first so sprite scaling, chunks and texture uploads aren't counted
+        self.update_camera()
+        self.draw_frame()
+        self.present_frame()
+        
+        start = time.perf_counter()
+        for _ in range(frames):
+            pygame.event.pump()
+            self.farm_animals.update(self.world_map)
+            self.update_camera()
+            if self.weather:
+                self.update_weather()
+            self.animation_frame = self.get_animation_frame()
+            self.light_step = get_light_step(self.get_time_of_day())
+            self.draw_frame()
+            self.present_frame()
+        return (time.perf_counter() - start) * 1000 / frames
+        
     def run(self) -> None:
         """Main game loop"""
         running = True
+        self.sim_start_time = pygame.time.get_ticks()
+        self.sim_ticks = 0
         
         while running:
             # Handle events
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.MOUSEWHEEL:
+                    # Scroll up to zoom in, down to zoom out
+                    self.change_zoom(1 if event.y > 0 else -1)
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         self.handle_interaction()
                     elif event.key == pygame.K_ESCAPE:
-                        self.show_dialogue = False
+                        for viewport in self.viewports:
+                            self.close_dialogue(viewport)
+                        self.show_world_map = False
+                    elif event.key == pygame.K_m:
+                        self.show_world_map = not self.show_world_map
+                    elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER) and self.coop:
+                        self.handle_interaction(self.players[1])
                     elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
                         # Increase volume
                         current_volume = self.sound_manager.volume
                         self.sound_manager.set_volume(min(1.0, current_volume + 0.1))
                         print(f"🔊 Volume: {int(self.sound_manager.volume * 100)}%")
+                    elif event.key == pygame.K_RIGHTBRACKET:
+                        self.change_zoom(1)
+                    elif event.key == pygame.K_LEFTBRACKET:
+                        self.change_zoom(-1)
                     elif event.key == pygame.K_MINUS:
                         # Decrease volume
                         current_volume = self.sound_manager.volume
@@ -684,43 +1241,68 @@ class Game:
             # Handle input
             self.handle_input()
             
-            # Update animals
-            self.farm_animals.update(self.world_map)
+            # Update animals - in idle mode they also catch up on any ticks slept through
+            ticks = self.get_simulation_ticks() if self.idle else 1
+            self.farm_animals.update(self.world_map, ticks)
             
-            # Update camera
+            # Update camera, the tile animation clock and the time of day
             self.update_camera()
+            if self.weather:
+                self.update_weather(ticks)
+            self.animation_frame = self.get_animation_frame()
+            self.light_step = get_light_step(self.get_time_of_day())
             
-            # Clear screen
-            self.screen.fill(BLACK)
-            
-            # Draw world
-            self.draw_world()
-            
-            # Draw animals
-            self.farm_animals.draw(self.screen, self.camera_x, self.camera_y)
-            
-            # Draw NPCs
-            for npc in self.npcs:
-                npc.draw(self.screen, self.camera_x, self.camera_y)
-                
-            # Check for interactions
-            self.check_interactions()
-            
-            # Draw player
-            self.player.draw(self.screen, self.camera_x, self.camera_y)
-            
-            # Draw UI
-            self.draw_ui()
+            # Skip drawing when the screen would look exactly like the last frame
+            if self.idle:
+                frame_state = self.get_frame_state()
+                if not events and frame_state == self.last_frame_state:
+                    if self.is_animating():
+                        # Something is moving by less than a pixel a tick - keep ticking, just don't redraw
+                        self.clock.tick(FPS)
+                    else:
+                        # Sleep until input arrives, then handle it straight away without a frame cap delay
+                        event = pygame.event.wait(self.get_idle_wait())
+                        if event.type != pygame.NOEVENT:
+                            pygame.event.post(event)
+                    continue
+                self.last_frame_state = frame_state
             
-            # Update display
-            pygame.display.flip()
+            # Draw the frame and push it to the display
+            if self.dirty_rects is not None:
+                self.present_dirty_rects()
+            else:
+                self.draw_frame()
+                self.present_frame()
             
             # Cap the frame rate
-            self.clock.tick(60)
+            self.clock.tick(FPS)
             
         pygame.quit()
         sys.exit()
 
+def export_world_map(path: str, seed: Optional[int] = None, scale: int = 1) -> None:
+    """Render the whole world with the game's sprites into one image file, without a window"""
+    # A hidden display on the dummy driver, just so sprites can be converted for fast blits
+    pygame.display.quit()
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    
+    world_map = Game.create_world(seed)
+    tilemap = LayeredTilemap(world_map)
+    level = ZoomLevel(1.0, tilemap, SpriteManager(), BuildingIndex(world_map), TILE_SIZE,
+                      autotile=AutotileMap(tilemap.ground))
+    
+    # Every chunk of every layer, queued and blitted in one batch per layer
+    image = pygame.Surface((WORLD_WIDTH * TILE_SIZE, WORLD_HEIGHT * TILE_SIZE)).convert()
+    draw_list = DrawList()
+    draw_list.begin(image)
+    level.submit(draw_list, 0, 0)
+    draw_list.flush(image)
+    if scale > 1:
+        image = pygame.transform.scale(image, (image.get_width() * scale, image.get_height() * scale))
+    pygame.image.save(image, path)
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="Ernie's Adventure - Collaborative World Explorer")
@@ -731,6 +1313,68 @@ def parse_arguments():
     parser.add_argument('--list-sections', 
                        action='store_true',
                        help='List all available spawn sections')
+    parser.add_argument('--dirty-rects',
+                       action='store_true',
+                       help='Only redraw and update the parts of the screen that changed')
+    parser.add_argument('--scroll-terrain',
+                       action='store_true',
+                       help='Reuse last frame\'s terrain when the camera scrolls and only draw the new strips')
+    parser.add_argument('--typewriter',
+                       action='store_true',
+                       help='Reveal dialogue one character at a time')
+    parser.add_argument('--atlas',
+                       action='store_true',
+                       help='Pack sprites into a texture atlas and draw tiles by integer handle')
+    parser.add_argument('--idle',
+                       action='store_true',
+                       help='Skip redrawing and sleep while nothing on screen changes')
+    parser.add_argument('--scale',
+                       type=int,
+                       help='Draw at 800x600 and scale up by this whole number (0 = biggest that fits); '
+                            'with --export-map, scale the exported image up by it')
+    parser.add_argument('--fullscreen',
+                       action='store_true',
+                       help='Fill the screen, scaling the 800x600 frame up and letterboxing the rest')
+    parser.add_argument('--backend',
+                       choices=['surface', 'texture', 'texture-software'],
+                       default='surface',
+                       help='Draw with Surface blits, or with SDL textures on the GPU or software renderer')
+    parser.add_argument('--benchmark',
+                       type=int,
+                       metavar='FRAMES',
+                       help='Draw this many frames as fast as possible, print the time per frame and exit')
+    parser.add_argument('--day-night',
+                       action='store_true',
+                       help='Let time pass, with night falling and windows lighting up')
+    parser.add_argument('--hour',
+                       type=float,
+                       default=12.0,
+                       help='Time of day to start at, 0-24 (e.g. 22 for night)')
+    parser.add_argument('--weather',
+                       action='store_true',
+                       help='Rain, with snow in the mountains and falling leaves in the forest')
+    parser.add_argument('--fog',
+                       action='store_true',
+                       help='Hide the parts of the minimap you haven\'t explored yet')
+    parser.add_argument('--coop',
+                       action='store_true',
+                       help='Two-player split screen: player one on WASD/SPACE, player two on the arrows/ENTER')
+    parser.add_argument('--prerender-workers',
+                       type=int,
+                       default=0,
+                       metavar='N',
+                       help='Render every terrain chunk at startup on N processes (0 = as they come into view)')
+    parser.add_argument('--export-map',
+                       metavar='PNG',
+                       help='Save the whole world as one image and exit, without opening a window')
+    parser.add_argument('--seed',
+                       type=int,
+                       help='Random seed for generating the world, so exports can be compared')
+    parser.add_argument('--zoom',
+                       type=float,
+                       choices=ZOOM_LEVELS,
+                       default=1.0,
+                       help='Starting camera zoom (change in game with [ and ])')
     
     return parser.parse_args()
 
@@ -754,10 +1398,26 @@ if __name__ == "__main__":
         list_sections()
         sys.exit(0)
     
+    if args.export_map:
+        start = time.perf_counter()
+        export_world_map(args.export_map, args.seed, max(1, args.scale or 1))
+        print(f"🗺️  Saved the world to {args.export_map} in {time.perf_counter() - start:.2f}s")
+        pygame.quit()
+        sys.exit(0)
+    
     print(f"🎮 Starting Ernie's Adventure...")
     print(f"📍 Spawning in: {WORLD_SECTIONS[args.spawn]['name']}")
     print(f"📝 {WORLD_SECTIONS[args.spawn]['description']}")
     print()
     
-    game = Game(spawn_section=args.spawn)
+    game = Game(spawn_section=args.spawn, dirty_rects=args.dirty_rects, scroll_terrain=args.scroll_terrain,
+                typewriter=args.typewriter, atlas=args.atlas, idle=args.idle,
+                zoom=args.zoom, scale=args.scale, fullscreen=args.fullscreen, backend=args.backend,
+                day_night=args.day_night, hour=args.hour, weather=args.weather, fog_of_war=args.fog,
+                coop=args.coop, prerender_workers=args.prerender_workers, seed=args.seed)
+    if args.benchmark:
+        ms_per_frame = game.benchmark(args.benchmark)
+        print(f"⏱️  {args.backend}: {ms_per_frame:.2f} ms/frame ({1000 / ms_per_frame:.0f} fps) over {args.benchmark} frames")
+        pygame.quit()
+        sys.exit(0)
     game.run() 
\ No newline at end of file
@@ -0,0 +1,46 @@
+# Rendering package for Ernie's Adventure
+# Terrain drawing and the caches that keep it cheap every frame
+
+from .terrain import TerrainRenderer
+from .chunk_cache import ChunkCache, CHUNK_SIZE
+from .chunk_prerender import prerender_chunks
+from .dirty_rects import DirtyRectTracker
+from .scroll_buffer import ScrollingTerrainBuffer
+from .minimap import Minimap
+from .text_cache import TextCache
+from .dialogue_box import DialogueBox
+from .draw_list import DrawList
+from .render_queue import RenderQueue
+from .zoom import ZoomLevel, ZOOM_LEVELS
+from .upscaler import IntegerUpscaler
+from .texture_backend import TextureBackend, TEXTURES_AVAILABLE
+from .lighting import LightmapCache, LightSource, get_light_step
+from .weather import ParticleSystem, WEATHER_AVAILABLE
+from .exploration import ExplorationMap
+from .world_map import WorldMapOverlay
+
+__all__ = [
+    'TerrainRenderer',
+    'ChunkCache',
+    'CHUNK_SIZE',
+    'prerender_chunks',
+    'DirtyRectTracker',
+    'ScrollingTerrainBuffer',
+    'Minimap',
+    'TextCache',
+    'DialogueBox',
+    'DrawList',
+    'RenderQueue',
+    'ZoomLevel',
+    'ZOOM_LEVELS',
+    'IntegerUpscaler',
+    'TextureBackend',
+    'TEXTURES_AVAILABLE',
+    'LightmapCache',
+    'LightSource',
+    'get_light_step',
+    'ParticleSystem',
+    'WEATHER_AVAILABLE',
+    'ExplorationMap',
+    'WorldMapOverlay'
+]
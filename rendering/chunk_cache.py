@@ -0,0 +1,167 @@
+"""
+🧱 Chunk Cache - Ernie's Adventure
+Pre-rendered terrain chunks so the world is drawn with a handful of blits
+
+This file contains:
+- Lazy rendering of fixed-size terrain chunks (16x16 tiles by default)
+- Per-chunk invalidation when tiles change
+- Viewport drawing with at most 3x3 chunk blits at 800x600
+- Animated tiles kept in a per-chunk list and redrawn alone when the animation frame changes
+- Adopting chunks rendered elsewhere, e.g. by the multiprocess pre-render
+"""
+
+import pygame
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .draw_list import DrawList
+from .terrain import TerrainRenderer
+
+CHUNK_SIZE = 16  # tiles per chunk side
+
+
+class ChunkCache:
+    """Caches terrain as chunk surfaces and blits only the chunks in view"""
+
+    def __init__(self, terrain: TerrainRenderer, chunk_size: int = CHUNK_SIZE):
+        self.terrain = terrain
+        self.chunk_size = chunk_size
+        self.chunk_pixels = chunk_size * terrain.tile_size
+        self.chunks_x = (terrain.world_width + chunk_size - 1) // chunk_size
+        self.chunks_y = (terrain.world_height + chunk_size - 1) // chunk_size
+        self.transparent = terrain.layer != 'ground'  # overlay layers keep see-through chunks
+        self.chunks: Dict[Tuple[int, int], Optional[pygame.Surface]] = {}  # None for an empty overlay chunk
+
+        # Animated tiles of each rendered chunk as (frame strip, position in chunk), and the frame they show
+        self.animated_cells: Dict[Tuple[int, int], List[Tuple[pygame.Surface, Tuple[int, int]]]] = {}
+        self.chunk_frames: Dict[Tuple[int, int], int] = {}
+        self.animating = False  # animated tiles were in view last time the view was listed
+        self.on_chunk_changed: Optional[Callable[[pygame.Surface], None]] = None  # told about redrawn chunks
+
+    def get_chunk(self, chunk_x: int, chunk_y: int) -> Optional[pygame.Surface]:
+        """Return the surface for a chunk, rendering it the first time it is needed"""
+        key = (chunk_x, chunk_y)
+        if key not in self.chunks:
+            self.chunks[key] = self._render_chunk(chunk_x, chunk_y)
+        elif self.chunk_frames.get(key, self.terrain.animation_frame) != self.terrain.animation_frame:
+            self._refresh_animated(key)
+        return self.chunks[key]
+
+    def _render_chunk(self, chunk_x: int, chunk_y: int) -> Optional[pygame.Surface]:
+        """Draw every tile of a chunk onto a new surface"""
+        start_x = chunk_x * self.chunk_size
+        start_y = chunk_y * self.chunk_size
+        if self.transparent:
+            if self.is_chunk_empty(chunk_x, chunk_y):
+                return None
+            chunk = pygame.Surface((self.chunk_pixels, self.chunk_pixels), pygame.SRCALPHA)
+        else:
+            chunk = pygame.Surface((self.chunk_pixels, self.chunk_pixels))
+            chunk.fill((0, 0, 0))
+        origin_x = start_x * self.terrain.tile_size
+        origin_y = start_y * self.terrain.tile_size
+        self.terrain.draw_region(chunk, start_x, start_y,
+                                 start_x + self.chunk_size, start_y + self.chunk_size, origin_x, origin_y)
+        self._find_animated((chunk_x, chunk_y), self.terrain.animation_frame)
+        return chunk
+
+    def _find_animated(self, key: Tuple[int, int], frame: int) -> None:
+        """Remember the animated tiles of a newly rendered chunk, drawn at this frame"""
+        start_x = key[0] * self.chunk_size
+        start_y = key[1] * self.chunk_size
+        cells = self.terrain.get_animated_cells(start_x, start_y, start_x + self.chunk_size,
+                                                start_y + self.chunk_size, start_x * self.terrain.tile_size,
+                                                start_y * self.terrain.tile_size)
+        if cells:
+            self.animated_cells[key] = cells
+            self.chunk_frames[key] = frame
+
+    def is_chunk_empty(self, chunk_x: int, chunk_y: int) -> bool:
+        """Check if a chunk has nothing to draw - only overlay layers have empty chunks"""
+        start_x = chunk_x * self.chunk_size
+        start_y = chunk_y * self.chunk_size
+        return self.transparent and self.terrain.is_region_empty(start_x, start_y, start_x + self.chunk_size,
+                                                                 start_y + self.chunk_size)
+
+    def set_chunk(self, chunk_x: int, chunk_y: int, chunk: Optional[pygame.Surface], frame: int) -> None:
+        """Adopt a chunk rendered somewhere else, showing animated tiles at this frame"""
+        key = (chunk_x, chunk_y)
+        self._forget(key)
+        self.chunks[key] = chunk
+        if chunk is not None:
+            self._find_animated(key, frame)
+
+    def _refresh_animated(self, key: Tuple[int, int]) -> None:
+        """Redraw just the animated tiles of a chunk at the terrain's current animation frame"""
+        chunk = self.chunks[key]
+        tile_size = self.terrain.tile_size
+        frame = self.terrain.animation_frame
+        area = pygame.Rect(frame * tile_size, 0, tile_size, tile_size)
+        cells = self.animated_cells[key]
+        if self.transparent:
+            for _, position in cells:
+                chunk.fill((0, 0, 0, 0), (position, (tile_size, tile_size)))
+        chunk.blits([(strip, position, area) for strip, position in cells], doreturn=False)
+        self.chunk_frames[key] = frame
+        if self.on_chunk_changed is not None:
+            self.on_chunk_changed(chunk)
+
+    def _forget(self, key: Tuple[int, int]) -> None:
+        """Drop a rendered chunk and its animated tiles"""
+        self.chunks.pop(key, None)
+        self.animated_cells.pop(key, None)
+        self.chunk_frames.pop(key, None)
+
+    def prerender_all(self) -> None:
+        """Render every chunk up front instead of on first sight"""
+        for chunk_y in range(self.chunks_y):
+            for chunk_x in range(self.chunks_x):
+                self.get_chunk(chunk_x, chunk_y)
+
+    def invalidate_tile(self, x: int, y: int) -> None:
+        """Forget the chunk holding this tile so it is re-rendered next draw"""
+        self._forget((x // self.chunk_size, y // self.chunk_size))
+
+    def invalidate_area(self, start_x: int, start_y: int, end_x: int, end_y: int) -> None:
+        """Forget every chunk overlapping the tile area [start, end)"""
+        first_x = max(0, start_x) // self.chunk_size
+        first_y = max(0, start_y) // self.chunk_size
+        last_x = (max(0, end_x - 1)) // self.chunk_size
+        last_y = (max(0, end_y - 1)) // self.chunk_size
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                self._forget((chunk_x, chunk_y))
+
+    def invalidate_all(self) -> None:
+        """Forget all rendered chunks"""
+        self.chunks.clear()
+        self.animated_cells.clear()
+        self.chunk_frames.clear()
+
+    def get_visible_blits(self, camera_x: int, camera_y: int,
+                          view_size: Tuple[int, int]) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """List the (chunk surface, screen position) pairs covering the camera view"""
+        view_width, view_height = view_size
+        first_x = max(0, camera_x // self.chunk_pixels)
+        first_y = max(0, camera_y // self.chunk_pixels)
+        last_x = min(self.chunks_x - 1, (camera_x + view_width - 1) // self.chunk_pixels)
+        last_y = min(self.chunks_y - 1, (camera_y + view_height - 1) // self.chunk_pixels)
+
+        blits = []
+        self.animating = False
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self.get_chunk(chunk_x, chunk_y)
+                if (chunk_x, chunk_y) in self.animated_cells:
+                    self.animating = True
+                if chunk is not None:
+                    blits.append((chunk, (chunk_x * self.chunk_pixels - camera_x,
+                                          chunk_y * self.chunk_pixels - camera_y)))
+        return blits
+
+    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int) -> None:
+        """Blit the chunks covering the camera view"""
+        screen.blits(self.get_visible_blits(camera_x, camera_y, screen.get_size()), doreturn=False)
+
+    def submit(self, draw_list: DrawList, camera_x: int, camera_y: int, layer: str = 'ground') -> None:
+        """Queue the chunks covering the camera view on a draw list"""
+        draw_list.extend(self.get_visible_blits(camera_x, camera_y, draw_list.view_size), layer)
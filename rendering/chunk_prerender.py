@@ -0,0 +1,163 @@
+"""
+🏭 Chunk Pre-rendering - Ernie's Adventure
+Renders every terrain chunk up front on several processes at once
+
+This file contains:
+- A process pool whose workers rebuild the tile layers and sprites once, on SDL's dummy driver
+- One shared memory block per layer that the workers draw chunks straight into
+- Chunk surfaces wrapped around that memory with frombuffer, without copying a pixel
+- Each block closed only once the last chunk surface using it is gone
+"""
+
+import os
+import weakref
+import pygame
+from multiprocessing import get_context, shared_memory
+from typing import Dict, List, Sequence, Tuple
+
+from sprite_manager import SpriteManager
+from buildings import BuildingIndex
+from autotile import AutotileMap
+from tilemap import LayeredTilemap, LAYERS
+from .chunk_cache import ChunkCache
+from .terrain import TerrainRenderer
+
+PIXEL_FORMAT = 'BGRA'  # byte order of SDL's usual 32-bit surfaces, so blitting the chunks needs no conversion
+BYTES_PER_PIXEL = 4
+WORKER_ENVIRONMENT = {'SDL_VIDEODRIVER': 'dummy', 'SDL_NO_SIGNAL_HANDLERS': '1'}
+
+# Each worker's own renderers and attached blocks, set up once when the worker starts
+_worker_terrains: Dict[str, TerrainRenderer] = {}
+_worker_blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+
+class SharedChunkMemory:
+    """A shared memory block of chunk pixels that stays open while any chunk surface uses it"""
+
+    def __init__(self, size: int):
+        self.block = shared_memory.SharedMemory(create=True, size=size)
+        self.name = self.block.name
+        self.views = 0  # chunk pixel views still alive
+
+    def wrap(self, offset: int, size: int, chunk_pixels: int) -> pygame.Surface:
+        """A chunk surface over some of the block's pixels, sharing them rather than copying"""
+        pixels = self.block.buf[offset:offset + size]
+        self.views += 1
+        # Runs once the view is released, so the block is only closed when nothing points into it.
+        # Not at exit - chunks can outlive this module there, and the OS unmaps the block anyway.
+        weakref.finalize(pixels, self._release).atexit = False
+        return pygame.image.frombuffer(pixels, (chunk_pixels, chunk_pixels), PIXEL_FORMAT)
+
+    def _release(self) -> None:
+        """Forget one released view, closing the block after the last"""
+        self.views -= 1
+        if self.views == 0:
+            self.block.close()
+
+
+def _init_worker(world_map: List[List[str]], tile_size: int) -> None:
+    """Build the sprites and a terrain renderer per layer, exactly as the game does"""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))  # hidden, so sprites are converted like the game's
+    sprite_manager = SpriteManager()
+    if tile_size != sprite_manager.tile_size:
+        sprite_manager.prescale_tiles(tile_size)
+    tilemap = LayeredTilemap(world_map)
+    building_index = BuildingIndex(world_map)
+    autotile = AutotileMap(tilemap.ground)
+    for layer in LAYERS:
+        _worker_terrains[layer] = TerrainRenderer(tilemap.get_layer(layer), sprite_manager, building_index,
+                                                  tile_size, layer, autotile if layer == 'ground' else None)
+
+
+def _render_into(task: Tuple[str, str, int, int, int, int, int]) -> None:
+    """Draw one chunk straight into its slot of a shared memory block"""
+    layer, block_name, offset, chunk_x, chunk_y, chunk_size, frame = task
+    block = _worker_blocks.get(block_name)
+    if block is None:
+        block = shared_memory.SharedMemory(block_name)
+        _worker_blocks[block_name] = block
+
+    terrain = _worker_terrains[layer]
+    terrain.animation_frame = frame
+    chunk_pixels = chunk_size * terrain.tile_size
+    size = chunk_pixels * chunk_pixels * BYTES_PER_PIXEL
+    chunk = pygame.image.frombuffer(block.buf[offset:offset + size], (chunk_pixels, chunk_pixels), PIXEL_FORMAT)
+    if layer == 'ground':
+        chunk.set_alpha(None)
+        chunk.fill((0, 0, 0))
+    else:
+        chunk.fill((0, 0, 0, 0))
+    start_x = chunk_x * chunk_size
+    start_y = chunk_y * chunk_size
+    terrain.draw_region(chunk, start_x, start_y, start_x + chunk_size, start_y + chunk_size,
+                        start_x * terrain.tile_size, start_y * terrain.tile_size)
+    if layer == 'ground':
+        # Opaque tiles blitted onto these pixels leave their alpha at 0 - make it 255 like an opaque surface's
+        chunk.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MAX)
+
+
+def prerender_chunks(world_map: List[List[str]], caches: Sequence[ChunkCache], workers: int) -> int:
+    """Render every chunk the caches don't have yet on a pool of worker processes
+
+    The caches must all be layers of one zoom level. Returns the number of chunks rendered.
+    """
+    tile_size = caches[0].terrain.tile_size
+    tasks = []
+    blocks = []
+    placements = []  # (cache, chunk key, memory, offset, frame)
+    for cache in caches:
+        frame = cache.terrain.animation_frame
+        keys = []
+        for chunk_y in range(cache.chunks_y):
+            for chunk_x in range(cache.chunks_x):
+                if (chunk_x, chunk_y) in cache.chunks:
+                    continue
+                if cache.is_chunk_empty(chunk_x, chunk_y):
+                    cache.set_chunk(chunk_x, chunk_y, None, frame)
+                else:
+                    keys.append((chunk_x, chunk_y))
+        if not keys:
+            continue
+
+        # One block per layer - a block per chunk would run out of file handles on big maps
+        chunk_bytes = cache.chunk_pixels * cache.chunk_pixels * BYTES_PER_PIXEL
+        memory = SharedChunkMemory(chunk_bytes * len(keys))
+        blocks.append(memory)
+        for index, (chunk_x, chunk_y) in enumerate(keys):
+            offset = index * chunk_bytes
+            tasks.append((cache.terrain.layer, memory.name, offset, chunk_x, chunk_y, cache.chunk_size, frame))
+            placements.append((cache, (chunk_x, chunk_y), memory, offset, frame))
+    if not tasks:
+        return 0
+
+    # Workers start with the dummy video driver, so none of them opens a window, and without
+    # SDL's signal handlers, which would swallow the SIGTERM that stops a pool after an error
+    saved = {name: os.environ.get(name) for name in WORKER_ENVIRONMENT}
+    os.environ.update(WORKER_ENVIRONMENT)
+    try:
+        pool = get_context('spawn').Pool(workers, _init_worker, (world_map, tile_size))
+        try:
+            pool.map(_render_into, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+        # The name can go now - this process keeps its mapping for as long as the chunks live
+        for memory in blocks:
+            memory.block.unlink()
+
+    for cache, (chunk_x, chunk_y), memory, offset, frame in placements:
+        chunk = memory.wrap(offset, cache.chunk_pixels * cache.chunk_pixels * BYTES_PER_PIXEL, cache.chunk_pixels)
+        if not cache.transparent:
+            chunk.set_alpha(None)  # ground chunks are opaque, and blit faster without per-pixel alpha
+        cache.set_chunk(chunk_x, chunk_y, chunk, frame)
+    return len(tasks)
@@ -0,0 +1,144 @@
+"""
+💬 Dialogue Box - Ernie's Adventure
+Pre-rendered dialogue panels with an optional typewriter reveal
+
+This file contains:
+- Word wrapping done once per dialogue string
+- A cached panel surface (background, border and text) per string
+- Typewriter reveal using area-clipped blits of the pre-rendered lines
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class DialoguePanel:
+    """Everything needed to draw one dialogue string, rendered once"""
+
+    def __init__(self, surface: pygame.Surface, lines: List[pygame.Surface],
+                 prefix_widths: List[List[int]]):
+        self.surface = surface              # background, border and all text
+        self.lines = lines                  # each wrapped line on its own
+        self.prefix_widths = prefix_widths  # pixel width of the first n characters of each line
+        self.total_chars = sum(len(widths) - 1 for widths in prefix_widths)
+
+
+class DialogueBox:
+    """Draws dialogue text in a bordered box at the bottom of the screen"""
+
+    def __init__(self, rect: pygame.Rect, font: pygame.font.Font, text_color: Tuple[int, int, int],
+                 background_color: Tuple[int, int, int], border_color: Tuple[int, int, int],
+                 max_lines: int = 3, line_height: int = 25, padding: int = 20,
+                 chars_per_second: int = 0, max_cached: int = 32):
+        self.rect = pygame.Rect(rect)
+        self.font = font
+        self.text_color = text_color
+        self.max_lines = max_lines
+        self.line_height = line_height
+        self.padding = padding
+        self.chars_per_second = chars_per_second  # 0 shows the whole text at once
+        self.max_cached = max_cached
+        self.panels: "OrderedDict[str, DialoguePanel]" = OrderedDict()
+
+        # Empty panel shared by every dialogue string
+        self.background = pygame.Surface(self.rect.size)
+        self.background.fill(background_color)
+        pygame.draw.rect(self.background, border_color, self.background.get_rect(), 3)
+
+        # Typewriter state
+        self.current_text = ""
+        self.reveal_start = 0
+        self.reveal_skipped = False
+
+    def wrap(self, text: str) -> List[str]:
+        """Split text into lines that fit inside the box"""
+        words = text.split(' ')
+        lines = []
+        current_line = ""
+        max_width = self.rect.width - self.padding
+
+        for word in words:
+            test_line = current_line + word + " "
+            if self.font.size(test_line)[0] < max_width:
+                current_line = test_line
+            else:
+                if current_line:
+                    lines.append(current_line.strip())
+                current_line = word + " "
+
+        if current_line:
+            lines.append(current_line.strip())
+        return lines[:self.max_lines]
+
+    def get_panel(self, text: str) -> DialoguePanel:
+        """Get the pre-rendered panel for a dialogue string"""
+        panel = self.panels.get(text)
+        if panel is not None:
+            self.panels.move_to_end(text)
+            return panel
+
+        surface = self.background.copy()
+        lines = []
+        prefix_widths = []
+        for i, line in enumerate(self.wrap(text)):
+            line_surface = self.font.render(line, True, self.text_color)
+            surface.blit(line_surface, (self.padding, self.padding + i * self.line_height))
+            lines.append(line_surface)
+            prefix_widths.append([self.font.size(line[:count])[0] for count in range(len(line) + 1)])
+
+        panel = DialoguePanel(surface, lines, prefix_widths)
+        self.panels[text] = panel
+        if len(self.panels) > self.max_cached:
+            self.panels.popitem(last=False)
+        return panel
+
+    def get_revealed_chars(self, text: str, now: Optional[int] = None) -> int:
+        """How many characters of the text the typewriter has shown so far"""
+        panel = self.get_panel(text)
+        if text != self.current_text:
+            self.start(text, now)
+        if self.chars_per_second <= 0 or self.reveal_skipped:
+            return panel.total_chars
+        now = pygame.time.get_ticks() if now is None else now
+        return min(panel.total_chars, (now - self.reveal_start) * self.chars_per_second // 1000)
+
+    def start(self, text: str, now: Optional[int] = None) -> None:
+        """Type a text out from its first character, even if it was the last one shown"""
+        self.current_text = text
+        self.reveal_start = pygame.time.get_ticks() if now is None else now
+        self.reveal_skipped = False
+
+    def stop(self) -> None:
+        """Forget the text being revealed when the box closes"""
+        self.current_text = ""
+        self.reveal_skipped = False
+
+    def is_revealing(self, text: str) -> bool:
+        """Check if the typewriter is still writing out this text"""
+        return self.get_revealed_chars(text) < self.get_panel(text).total_chars
+
+    def skip_reveal(self) -> None:
+        """Show the rest of the current text immediately"""
+        self.reveal_skipped = True
+
+    def draw(self, screen: pygame.Surface, text: str) -> None:
+        """Draw the dialogue box for this text"""
+        panel = self.get_panel(text)
+        revealed = self.get_revealed_chars(text)
+        if revealed >= panel.total_chars:
+            screen.blit(panel.surface, self.rect)
+            return
+
+        # Typewriter: blit the revealed part of each pre-rendered line
+        screen.blit(self.background, self.rect)
+        for i, line_surface in enumerate(panel.lines):
+            widths = panel.prefix_widths[i]
+            shown = min(revealed, len(widths) - 1)
+            if shown > 0:
+                screen.blit(line_surface,
+                            (self.rect.x + self.padding, self.rect.y + self.padding + i * self.line_height),
+                            (0, 0, widths[shown], line_surface.get_height()))
+            revealed -= shown
+            if revealed <= 0:
+                break
@@ -0,0 +1,72 @@
+"""
+🩹 Dirty Rectangles - Ernie's Adventure
+Tracks which parts of the screen changed so only those are redrawn and pushed
+
+This file contains:
+- Per-drawable bookkeeping of last frame's rectangle and visible state
+- Merging of overlapping changed rectangles for pygame.display.update
+"""
+
+import pygame
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class DirtyRectTracker:
+    """Compares what each drawable reported last frame with this frame"""
+
+    def __init__(self, screen_rect: pygame.Rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.previous: Dict[Hashable, Tuple[pygame.Rect, Any]] = {}
+        self.current: Dict[Hashable, Tuple[pygame.Rect, Any]] = {}
+        self.extra: List[pygame.Rect] = []
+        self.full_redraw = True
+
+    def track(self, key: Hashable, rect: pygame.Rect, state: Any = None) -> None:
+        """Report where a drawable is this frame and anything else that changes its pixels"""
+        self.current[key] = (pygame.Rect(rect), state)
+
+    def mark(self, rect: pygame.Rect) -> None:
+        """Force a screen area to be redrawn this frame"""
+        self.extra.append(pygame.Rect(rect))
+
+    def invalidate_all(self) -> None:
+        """Redraw and push the whole screen this frame"""
+        self.full_redraw = True
+
+    def collect(self) -> Optional[List[pygame.Rect]]:
+        """Finish the frame and return the rectangles to redraw, or None for a full redraw"""
+        if self.full_redraw:
+            dirty = None
+        else:
+            changed = list(self.extra)
+            for key in self.previous.keys() | self.current.keys():
+                before = self.previous.get(key)
+                after = self.current.get(key)
+                if before == after:
+                    continue
+                # Anything that moved or changed dirties both where it was and where it is now
+                if before is not None:
+                    changed.append(before[0])
+                if after is not None:
+                    changed.append(after[0])
+            dirty = self._merge([rect.clip(self.screen_rect) for rect in changed])
+
+        self.previous = self.current
+        self.current = {}
+        self.extra = []
+        self.full_redraw = False
+        return dirty
+
+    def _merge(self, rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Union overlapping rectangles so each area is redrawn only once"""
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            # Keep absorbing neighbours until this rectangle overlaps nothing else
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
@@ -0,0 +1,63 @@
+"""
+🖌️ Draw List - Ernie's Adventure
+Collects a frame's blits and submits them in batches
+
+This file contains:
+- Per-layer lists of (surface, dest, area) entries, with optional blend flags
+- One Surface.blits call per layer instead of one blit call per sprite
+- Draw call and sprite counts for the last frame
+"""
+
+import pygame
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+BlitEntry = Tuple[pygame.Surface, Tuple[int, int], Optional[pygame.Rect]]
+
+DEFAULT_LAYERS = ('ground', 'entities', 'overhead', 'lighting', 'ui')
+
+
+class DrawList:
+    """Gathers the blits for a frame and flushes each layer with a single blits call"""
+
+    def __init__(self, layers: Sequence[str] = DEFAULT_LAYERS):
+        self.layer_names = tuple(layers)
+        self.layers: Dict[str, List[BlitEntry]] = {name: [] for name in self.layer_names}
+        self.clip = pygame.Rect(0, 0, 0, 0)  # area of the target being redrawn
+        self.view_size = (0, 0)
+
+        # Stats for the last flush
+        self.draw_calls = 0
+        self.sprites_drawn = 0
+
+    def begin(self, target: pygame.Surface) -> None:
+        """Start a new frame for this target, dropping anything not yet flushed"""
+        self.clip = target.get_clip()
+        self.view_size = target.get_size()
+        for entries in self.layers.values():
+            entries.clear()
+
+    def add(self, surface: pygame.Surface, dest: Tuple[int, int], area: Optional[pygame.Rect] = None,
+            layer: str = 'entities') -> None:
+        """Queue one blit"""
+        self.layers[layer].append((surface, dest, area))
+
+    def extend(self, entries: Iterable[BlitEntry], layer: str = 'entities') -> None:
+        """Queue several blits at once"""
+        self.layers[layer].extend(entries)
+
+    def is_visible(self, rect: pygame.Rect) -> bool:
+        """Check if a screen rectangle touches the area being redrawn"""
+        return self.clip.colliderect(rect)
+
+    def flush(self, target: pygame.Surface) -> None:
+        """Blit every queued layer in order, one blits call per non-empty layer"""
+        self.draw_calls = 0
+        self.sprites_drawn = 0
+        for name in self.layer_names:
+            entries = self.layers[name]
+            if not entries:
+                continue
+            target.blits(entries, doreturn=False)
+            self.draw_calls += 1
+            self.sprites_drawn += len(entries)
+            entries.clear()
@@ -0,0 +1,130 @@
+"""
+🌫️ Exploration - Ernie's Adventure
+Fog of war: which tiles the player has seen, kept as a bitset
+
+This file contains:
+- One bit per tile, packed eight to a byte, row by row
+- Revealing only the tiles that scrolled into view along the camera's leading edge
+- Cached fog masks per scale, patched as tiles are revealed, so masking a map is one blit
+"""
+
+import pygame
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+Color = Tuple[int, int, int]
+
+CLEAR_KEY = (255, 0, 255)  # colour key left in the mask where tiles have been seen
+
+
+class ExplorationMap:
+    """Bit-packed record of the tiles that have been on screen"""
+
+    def __init__(self, world_width: int, world_height: int, fog_color: Color = (0, 0, 0)):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.fog_color = fog_color
+        self.row_bytes = (world_width + 7) // 8
+        self.bits = bytearray(self.row_bytes * world_height)
+        self.views: Dict[Hashable, pygame.Rect] = {}  # tile rect each viewer saw last update
+        self.revealed = 0  # grows every time fog is cleared, so callers can tell the masks changed
+        self.masks: Dict[int, pygame.Surface] = {}
+        self.on_mask_changed: Optional[Callable[[pygame.Surface], None]] = None  # told about masks patched in place
+
+    def is_explored(self, x: int, y: int) -> bool:
+        """Whether a tile has been seen"""
+        if not (0 <= x < self.world_width and 0 <= y < self.world_height):
+            return False
+        return bool(self.bits[y * self.row_bytes + (x >> 3)] & (1 << (x & 7)))
+
+    def update(self, view: pygame.Rect, viewer: Hashable = 0) -> None:
+        """Reveal the tiles in a view, skipping the part that was already in this viewer's last view
+
+        Only the strips the camera moved into are revealed, so a frame costs the
+        length of the leading edge rather than the area of the screen.
+        """
+        view = view.clip((0, 0, self.world_width, self.world_height))
+        last = self.views.get(viewer)
+        self.views[viewer] = view
+        if last is None or not view.colliderect(last):
+            self.reveal(view)
+            return
+        if view == last:
+            return
+
+        # Rows above and below the last view, across the whole new view
+        if view.top < last.top:
+            self.reveal(pygame.Rect(view.left, view.top, view.width, last.top - view.top))
+        if view.bottom > last.bottom:
+            self.reveal(pygame.Rect(view.left, last.bottom, view.width, view.bottom - last.bottom))
+        # Columns left and right of the last view, in the rows both views share
+        top = max(view.top, last.top)
+        height = min(view.bottom, last.bottom) - top
+        if view.left < last.left:
+            self.reveal(pygame.Rect(view.left, top, last.left - view.left, height))
+        if view.right > last.right:
+            self.reveal(pygame.Rect(last.right, top, view.right - last.right, height))
+
+    def reveal(self, area: pygame.Rect) -> None:
+        """Mark every tile in a tile rect as seen and clear it from the cached masks"""
+        area = area.clip((0, 0, self.world_width, self.world_height))
+        if area.width <= 0 or area.height <= 0:
+            return
+        start, end = area.left, area.right
+        first_byte, last_byte = start >> 3, (end - 1) >> 3
+        # Bits of the first and last bytes inside [start, end)
+        first_bits = (0xFF << (start & 7)) & 0xFF
+        last_bits = 0xFF >> (7 - ((end - 1) & 7))
+        full = b'\xff' * max(0, last_byte - first_byte - 1)
+
+        bits = self.bits
+        revealed = self.revealed
+        for y in range(area.top, area.bottom):
+            row = y * self.row_bytes
+            if first_byte == last_byte:
+                before = bits[row + first_byte]
+                bits[row + first_byte] |= first_bits & last_bits
+                if bits[row + first_byte] == before:
+                    continue
+            else:
+                seen = (bits[row + first_byte] & first_bits == first_bits and
+                        bits[row + last_byte] & last_bits == last_bits and
+                        bits[row + first_byte + 1:row + last_byte] == full)
+                if seen:
+                    continue
+                bits[row + first_byte] |= first_bits
+                bits[row + first_byte + 1:row + last_byte] = full
+                bits[row + last_byte] |= last_bits
+            self._clear_masks(start, y, end - start)
+        if self.revealed != revealed and self.on_mask_changed is not None:
+            for mask in self.masks.values():
+                self.on_mask_changed(mask)
+
+    def _clear_masks(self, x: int, y: int, width: int) -> None:
+        """Punch a revealed run of tiles out of every cached mask"""
+        self.revealed += width
+        for scale, mask in self.masks.items():
+            mask.fill(CLEAR_KEY, (x * scale, y * scale, width * scale, scale))
+
+    def get_mask(self, scale: int) -> pygame.Surface:
+        """Fog over the unexplored tiles at some pixels per tile, built the first time it is asked for"""
+        mask = self.masks.get(scale)
+        if mask is None:
+            mask = pygame.Surface((self.world_width * scale, self.world_height * scale))
+            mask.fill(self.fog_color)
+            mask.set_colorkey(CLEAR_KEY)
+            for y in range(self.world_height):
+                row = y * self.row_bytes
+                x = 0
+                while x < self.world_width:
+                    if self.bits[row + (x >> 3)] == 0 and x & 7 == 0:
+                        x += 8  # skip a whole unexplored byte
+                        continue
+                    if self.bits[row + (x >> 3)] & (1 << (x & 7)):
+                        run_start = x
+                        while x < self.world_width and self.bits[row + (x >> 3)] & (1 << (x & 7)):
+                            x += 1
+                        mask.fill(CLEAR_KEY, (run_start * scale, y * scale, (x - run_start) * scale, scale))
+                    else:
+                        x += 1
+            self.masks[scale] = mask
+        return mask
@@ -0,0 +1,146 @@
+"""
+🌙 Lighting - Ernie's Adventure
+Time of day, night darkness and glowing lights from cached lightmaps
+
+This file contains:
+- The light level for a time of day, quantized into a few darkness steps
+- Light sources placed in tile coordinates (windows, the forge, the tavern)
+- Per-chunk lightmaps rendered once per darkness step
+- Multiply blits of the visible lightmaps over the world, one blits call per frame
+"""
+
+import math
+import pygame
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .draw_list import DrawList
+
+LIGHT_STEPS = 8  # darkness steps from full daylight (0) to midnight (LIGHT_STEPS)
+NIGHT_COLOR = (60, 70, 130)  # the world is multiplied by this at midnight
+GLOW_RINGS = 12  # rings in a light's radial gradient
+
+Color = Tuple[int, int, int]
+
+
+def get_light_level(time_of_day: float) -> float:
+    """How bright the day is, from 0 at midnight to 1 between 6am and 6pm
+
+    time_of_day runs from 0 to 1, with 0 at midnight and 0.5 at noon.
+    """
+    daylight = (1 - math.cos(2 * math.pi * time_of_day)) / 2
+    return min(1.0, daylight * 2)
+
+
+def get_light_step(time_of_day: float) -> int:
+    """Darkness step for a time of day - lightmaps are only rebuilt when this changes"""
+    return round((1 - get_light_level(time_of_day)) * LIGHT_STEPS)
+
+
+def get_ambient_color(step: int) -> Color:
+    """Colour the world is multiplied by at a darkness step, before any lights"""
+    fraction = step / LIGHT_STEPS
+    return tuple(round(255 + (night - 255) * fraction) for night in NIGHT_COLOR)
+
+
+class LightSource:
+    """A glow centred on a point in tile coordinates"""
+
+    def __init__(self, x: float, y: float, radius: float, color: Color):
+        self.x = x              # tiles, may be fractional
+        self.y = y
+        self.radius = radius    # tiles
+        self.color = color      # brightest colour added at the centre at midnight
+
+    def __repr__(self) -> str:
+        return f"LightSource({self.x}, {self.y}, radius={self.radius}, color={self.color})"
+
+
+class LightmapCache:
+    """Lightmaps for a grid of chunks, rendered for the current darkness step and reused"""
+
+    def __init__(self, lights: Iterable[LightSource], world_width: int, world_height: int,
+                 tile_size: int, chunk_size: int):
+        self.tile_size = tile_size
+        self.chunk_size = chunk_size
+        self.chunk_pixels = chunk_size * tile_size
+        self.chunks_x = (world_width + chunk_size - 1) // chunk_size
+        self.chunks_y = (world_height + chunk_size - 1) // chunk_size
+        self.lights: List[LightSource] = list(lights)
+        self.step = 0
+        self.chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.glows: Dict[Tuple[int, Color], pygame.Surface] = {}
+
+    def set_lights(self, lights: Iterable[LightSource]) -> None:
+        """Replace the light sources, e.g. after buildings changed"""
+        self.lights = list(lights)
+        self.chunks.clear()
+
+    def set_step(self, step: int) -> None:
+        """Switch to another darkness step, dropping the lightmaps made for the old one"""
+        if step != self.step:
+            self.step = step
+            self.chunks.clear()
+            self.glows.clear()
+
+    def get_glow(self, radius: int, color: Color) -> pygame.Surface:
+        """Radial gradient for a light at the current step, added onto the ambient colour"""
+        key = (radius, color)
+        glow = self.glows.get(key)
+        if glow is None:
+            # Lights fade in as it gets darker
+            strength = self.step / LIGHT_STEPS
+            glow = pygame.Surface((radius * 2, radius * 2))
+            glow.fill((0, 0, 0))
+            for ring in range(GLOW_RINGS):
+                ring_strength = strength * ((ring + 1) / GLOW_RINGS) ** 2
+                ring_color = tuple(round(channel * ring_strength) for channel in color)
+                ring_radius = max(1, radius * (GLOW_RINGS - ring) // GLOW_RINGS)
+                pygame.draw.circle(glow, ring_color, (radius, radius), ring_radius)
+            self.glows[key] = glow
+        return glow
+
+    def get_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Return the lightmap for a chunk, rendering it the first time it is needed at this step"""
+        key = (chunk_x, chunk_y)
+        lightmap = self.chunks.get(key)
+        if lightmap is None:
+            lightmap = self._render_chunk(chunk_x, chunk_y)
+            self.chunks[key] = lightmap
+        return lightmap
+
+    def _render_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Fill a chunk with the ambient colour and add every light that reaches into it"""
+        lightmap = pygame.Surface((self.chunk_pixels, self.chunk_pixels))
+        lightmap.fill(get_ambient_color(self.step))
+        chunk_rect = pygame.Rect(chunk_x * self.chunk_pixels, chunk_y * self.chunk_pixels,
+                                 self.chunk_pixels, self.chunk_pixels)
+        for light in self.lights:
+            radius = max(1, round(light.radius * self.tile_size))
+            center_x = round(light.x * self.tile_size)
+            center_y = round(light.y * self.tile_size)
+            light_rect = pygame.Rect(center_x - radius, center_y - radius, radius * 2, radius * 2)
+            if light_rect.colliderect(chunk_rect):
+                lightmap.blit(self.get_glow(radius, light.color),
+                              (light_rect.x - chunk_rect.x, light_rect.y - chunk_rect.y),
+                              special_flags=pygame.BLEND_RGB_ADD)
+        return lightmap
+
+    def get_visible_blits(self, camera_x: int, camera_y: int,
+                          view_size: Tuple[int, int]) -> List[Tuple[pygame.Surface, Tuple[int, int], Optional[pygame.Rect], int]]:
+        """List multiply blits of the lightmaps covering the camera view - none in full daylight"""
+        if self.step == 0:
+            return []
+        view_width, view_height = view_size
+        first_x = max(0, camera_x // self.chunk_pixels)
+        first_y = max(0, camera_y // self.chunk_pixels)
+        last_x = min(self.chunks_x - 1, (camera_x + view_width - 1) // self.chunk_pixels)
+        last_y = min(self.chunks_y - 1, (camera_y + view_height - 1) // self.chunk_pixels)
+        return [(self.get_chunk(chunk_x, chunk_y),
+                 (chunk_x * self.chunk_pixels - camera_x, chunk_y * self.chunk_pixels - camera_y),
+                 None, pygame.BLEND_RGB_MULT)
+                for chunk_y in range(first_y, last_y + 1)
+                for chunk_x in range(first_x, last_x + 1)]
+
+    def submit(self, draw_list: DrawList, camera_x: int, camera_y: int, layer: str = 'lighting') -> None:
+        """Queue the visible lightmaps on a draw list"""
+        draw_list.extend(self.get_visible_blits(camera_x, camera_y, draw_list.view_size), layer)
@@ -0,0 +1,113 @@
+"""
+🧭 Minimap - Ernie's Adventure
+A cached minimap texture with a live marker overlay
+
+This file contains:
+- One-pixel-per-tile world texture built once from the tile grid
+- A pre-scaled copy so each frame is a single area blit
+- Per-tile updates when the world changes
+- Fog over unexplored tiles from the exploration map's cached mask
+"""
+
+import pygame
+from typing import Dict, Iterable, List, Tuple
+
+from buildings import BuildingIndex
+from .exploration import ExplorationMap
+
+Color = Tuple[int, int, int]
+
+
+class Minimap:
+    """Renders the world once into a texture and blits the window around the player"""
+
+    def __init__(self, world_map: List[List[str]], building_index: BuildingIndex,
+                 colors: Dict[str, Color], default_color: Color, building_color: Color,
+                 marker_colors: Dict[str, Color], size: int = 120, scale: int = 3,
+                 exploration: ExplorationMap = None):
+        self.world_map = world_map
+        self.building_index = building_index
+        self.colors = colors
+        self.default_color = default_color
+        self.building_color = building_color
+        self.marker_colors = marker_colors  # 'border', 'player', 'npc' and 'animal'
+        self.size = size
+        self.scale = scale
+        self.tiles = size // scale  # tiles shown across the minimap
+        self.world_height = len(world_map)
+        self.world_width = len(world_map[0]) if self.world_height > 0 else 0
+        self.exploration = exploration  # hides tiles not seen yet when set
+
+        self.texture = pygame.Surface((self.world_width, self.world_height))
+        self.scaled_texture = None
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Render the whole world texture and its scaled copy"""
+        for y in range(self.world_height):
+            for x in range(self.world_width):
+                self.texture.set_at((x, y), self._tile_color(x, y))
+        self.scaled_texture = pygame.transform.scale(
+            self.texture, (self.world_width * self.scale, self.world_height * self.scale))
+
+    def update_area(self, start_x: int, start_y: int, end_x: int, end_y: int) -> None:
+        """Recolour just the pixels for the tile area [start, end)"""
+        for y in range(max(0, start_y), min(self.world_height, end_y)):
+            for x in range(max(0, start_x), min(self.world_width, end_x)):
+                color = self._tile_color(x, y)
+                self.texture.set_at((x, y), color)
+                self.scaled_texture.fill(color, (x * self.scale, y * self.scale, self.scale, self.scale))
+
+    def _tile_color(self, x: int, y: int) -> Color:
+        """Choose the minimap colour for one tile"""
+        if self.building_index.building_at(x, y) is not None:
+            return self.building_color
+        return self.colors.get(self.world_map[y][x], self.default_color)
+
+    def get_view_origin(self, player_tile_x: int, player_tile_y: int) -> Tuple[int, int]:
+        """Top-left tile of the minimap window, centred on the player"""
+        map_half = self.tiles // 2
+        start_x = max(0, min(self.world_width - self.tiles, player_tile_x - map_half))
+        start_y = max(0, min(self.world_height - self.tiles, player_tile_y - map_half))
+        return start_x, start_y
+
+    def draw(self, screen: pygame.Surface, minimap_x: int, minimap_y: int,
+             player_tile: Tuple[int, int], npc_tiles: Iterable[Tuple[int, int]],
+             animal_tiles: Iterable[Tuple[int, int]]) -> None:
+        """Blit the window around the player and draw the markers on top"""
+        scale = self.scale
+        start_x, start_y = self.get_view_origin(*player_tile)
+
+        # Draw minimap background and the cached map window
+        pygame.draw.rect(screen, (0, 0, 0), (minimap_x, minimap_y, self.size, self.size))
+        pygame.draw.rect(screen, self.marker_colors['border'], (minimap_x, minimap_y, self.size, self.size), 2)
+        screen.blit(self.scaled_texture, (minimap_x, minimap_y),
+                    (start_x * scale, start_y * scale, self.tiles * scale, self.tiles * scale))
+        if self.exploration is not None:
+            screen.blit(self.exploration.get_mask(scale), (minimap_x, minimap_y),
+                        (start_x * scale, start_y * scale, self.tiles * scale, self.tiles * scale))
+
+        def in_view(tile_x: int, tile_y: int) -> bool:
+            if self.exploration is not None and not self.exploration.is_explored(tile_x, tile_y):
+                return False
+            return (start_x <= tile_x < start_x + self.tiles and
+                    start_y <= tile_y < start_y + self.tiles)
+
+        # Draw animals on minimap
+        for tile_x, tile_y in animal_tiles:
+            if in_view(tile_x, tile_y):
+                screen.fill(self.marker_colors['animal'], (minimap_x + (tile_x - start_x) * scale,
+                                                           minimap_y + (tile_y - start_y) * scale,
+                                                           scale - 1, scale - 1))
+
+        # Draw player position on minimap
+        player_mini_x = minimap_x + (player_tile[0] - start_x) * scale
+        player_mini_y = minimap_y + (player_tile[1] - start_y) * scale
+        pygame.draw.rect(screen, self.marker_colors['player'], (player_mini_x, player_mini_y, scale, scale))
+
+        # Draw NPCs on minimap
+        for tile_x, tile_y in npc_tiles:
+            if in_view(tile_x, tile_y):
+                pygame.draw.circle(screen, self.marker_colors['npc'],
+                                   (minimap_x + (tile_x - start_x) * scale + scale//2,
+                                    minimap_y + (tile_y - start_y) * scale + scale//2), 2)
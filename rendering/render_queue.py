@@ -0,0 +1,83 @@
+"""
+🗂️ Render Queue - Ernie's Adventure
+Layered draw list with camera culling and depth-sorted characters
+
+This file contains:
+- Submission of drawables that are culled against the view before any drawing
+- Depth sorting by foot y-coordinate so characters overlap correctly
+- An incremental insertion sort that reuses last frame's order
+"""
+
+import pygame
+from typing import Dict, List, Sequence
+
+from .draw_list import DrawList, DEFAULT_LAYERS
+
+
+class RenderQueue(DrawList):
+    """Draw list that also culls and y-sorts the characters submitted to it
+
+    Drawables need get_screen_rect(camera_x, camera_y, zoom), get_sort_y() and
+    draw(draw_list, camera_x, camera_y, zoom). The queue calls draw on the
+    visible ones, back to front, when it is flushed.
+    """
+
+    def __init__(self, layers: Sequence[str] = DEFAULT_LAYERS):
+        super().__init__(layers)
+        self.camera_x = 0
+        self.camera_y = 0
+        self.zoom = 1.0
+        self.pending: List = []
+        self.order: List = []  # last frame's back-to-front order
+
+        # Stats for the last frame
+        self.submitted = 0
+        self.culled = 0
+
+    def begin(self, target: pygame.Surface, camera_x: int = 0, camera_y: int = 0, zoom: float = 1.0) -> None:
+        """Start a new frame for this target, camera position and zoom"""
+        super().begin(target)
+        self.camera_x = camera_x
+        self.camera_y = camera_y
+        self.zoom = zoom
+        self.pending.clear()
+        self.submitted = 0
+        self.culled = 0
+
+    def submit(self, drawable) -> None:
+        """Queue a character to be depth-sorted and drawn if it is in view"""
+        self.submitted += 1
+        if self.clip.colliderect(drawable.get_screen_rect(self.camera_x, self.camera_y, self.zoom)):
+            self.pending.append(drawable)
+        else:
+            self.culled += 1
+
+    def flush(self, target: pygame.Surface) -> None:
+        """Draw the visible characters back to front, then blit every layer"""
+        visible = set(self.pending)
+        # Keep last frame's order for characters still in view and add newcomers at the end
+        order = [drawable for drawable in self.order if drawable in visible]
+        if len(order) < len(self.pending):
+            already_ordered = set(order)
+            order.extend(drawable for drawable in self.pending if drawable not in already_ordered)
+
+        sort_keys = {drawable: drawable.get_sort_y() for drawable in order}
+        _insertion_sort(order, sort_keys)
+        self.order = order
+        self.pending.clear()
+
+        for drawable in order:
+            drawable.draw(self, self.camera_x, self.camera_y, self.zoom)
+        super().flush(target)
+
+
+def _insertion_sort(items: List, keys: Dict) -> None:
+    """Sort items in place by keys[item] - close to linear when they are already nearly sorted"""
+    for i in range(1, len(items)):
+        item = items[i]
+        key = keys[item]
+        j = i - 1
+        while j >= 0 and keys[items[j]] > key:
+            items[j + 1] = items[j]
+            j -= 1
+        items[j + 1] = item
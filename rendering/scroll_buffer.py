@@ -0,0 +1,132 @@
+"""
+📜 Scrolling Terrain Buffer - Ernie's Adventure
+Reuses last frame's terrain when the camera moves a few pixels
+
+This file contains:
+- A screen-sized terrain back-buffer that is shifted by the camera delta
+- Rendering of only the newly exposed row/column strips of tiles
+- Redrawing runs of animated tiles when the animation frame changes
+"""
+
+import pygame
+from typing import Optional, Sequence, Tuple
+
+from tilemap import ANIMATED_TILES
+
+from .draw_list import DrawList
+from .terrain import TerrainRenderer
+
+
+class ScrollingTerrainBuffer:
+    """Keeps the visible terrain in a back-buffer and scrolls it with the camera"""
+
+    def __init__(self, terrain: TerrainRenderer, view_size: Tuple[int, int],
+                 overlays: Sequence[TerrainRenderer] = ()):
+        self.terrain = terrain
+        self.overlays = tuple(overlays)  # layers drawn over the terrain, such as decorations
+        self.surface = pygame.Surface(view_size)
+        self.camera: Optional[Tuple[int, int]] = None
+        self.frame = terrain.animation_frame  # animation frame the buffer shows
+        self.animating = False  # animated tiles were in view at the last frame change
+
+    def invalidate(self) -> None:
+        """Throw away the buffer so the next update redraws everything"""
+        self.camera = None
+
+    def invalidate_area(self, start_x: int, start_y: int, end_x: int, end_y: int) -> None:
+        """Redraw the part of the buffer covering the tile area [start, end)"""
+        if self.camera is None:
+            return
+        tile_size = self.terrain.tile_size
+        camera_x, camera_y = self.camera
+        area = pygame.Rect(start_x * tile_size - camera_x, start_y * tile_size - camera_y,
+                           (end_x - start_x) * tile_size, (end_y - start_y) * tile_size)
+        self._render_rect(area.clip(self.surface.get_rect()))
+
+    def update(self, camera_x: int, camera_y: int) -> None:
+        """Bring the buffer in line with the camera, drawing only what scrolled into view"""
+        width, height = self.surface.get_size()
+        if self.camera is None:
+            self.camera = (camera_x, camera_y)
+            self.frame = self.terrain.animation_frame
+            self.animating = True
+            self._render_rect(self.surface.get_rect())
+            return
+
+        if self.frame != self.terrain.animation_frame:
+            self.frame = self.terrain.animation_frame
+            self._refresh_animated()
+
+        dx = camera_x - self.camera[0]
+        dy = camera_y - self.camera[1]
+        if dx == 0 and dy == 0:
+            return
+        self.camera = (camera_x, camera_y)
+        self.animating = True  # until the next frame change looks at what is now in view
+        if abs(dx) >= width or abs(dy) >= height:
+            # Nothing from the previous frame is still visible
+            self._render_rect(self.surface.get_rect())
+            return
+
+        # Shift what is still valid, then fill in the strips that were exposed
+        self.surface.scroll(-dx, -dy)
+        if dx > 0:
+            self._render_rect(pygame.Rect(width - dx, 0, dx, height))
+        elif dx < 0:
+            self._render_rect(pygame.Rect(0, 0, -dx, height))
+        if dy > 0:
+            self._render_rect(pygame.Rect(0, height - dy, width, dy))
+        elif dy < 0:
+            self._render_rect(pygame.Rect(0, 0, width, -dy))
+
+    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int) -> None:
+        """Scroll the buffer to the camera and blit it to the screen"""
+        self.update(camera_x, camera_y)
+        screen.blit(self.surface, (0, 0))
+
+    def submit(self, draw_list: DrawList, camera_x: int, camera_y: int, layer: str = 'ground') -> None:
+        """Scroll the buffer to the camera and queue it on a draw list"""
+        self.update(camera_x, camera_y)
+        draw_list.add(self.surface, (0, 0), layer=layer)
+
+    def _refresh_animated(self) -> None:
+        """Redraw the animated tiles in view, one rectangle per horizontal run of them"""
+        tile_size = self.terrain.tile_size
+        camera_x, camera_y = self.camera
+        width, height = self.surface.get_size()
+        grids = [self.terrain.world_map] + [overlay.world_map for overlay in self.overlays]
+        start_x = max(0, camera_x // tile_size)
+        end_x = min(self.terrain.world_width, (camera_x + width + tile_size - 1) // tile_size)
+        self.animating = False
+        for y in range(max(0, camera_y // tile_size),
+                       min(self.terrain.world_height, (camera_y + height + tile_size - 1) // tile_size)):
+            rows = [grid[y] for grid in grids]
+            run_start = None
+            for x in range(start_x, end_x + 1):
+                animated = x < end_x and any(row[x] in ANIMATED_TILES for row in rows)
+                if animated and run_start is None:
+                    run_start = x
+                elif not animated and run_start is not None:
+                    self._render_rect(pygame.Rect(run_start * tile_size - camera_x, y * tile_size - camera_y,
+                                                  (x - run_start) * tile_size, tile_size)
+                                      .clip(self.surface.get_rect()))
+                    self.animating = True
+                    run_start = None
+
+    def _render_rect(self, area: pygame.Rect) -> None:
+        """Redraw the tiles under a buffer-space rectangle"""
+        if area.width <= 0 or area.height <= 0:
+            return
+        tile_size = self.terrain.tile_size
+        camera_x, camera_y = self.camera
+        start_x = (camera_x + area.left) // tile_size
+        start_y = (camera_y + area.top) // tile_size
+        end_x = (camera_x + area.right + tile_size - 1) // tile_size
+        end_y = (camera_y + area.bottom + tile_size - 1) // tile_size
+
+        self.surface.set_clip(area)
+        self.surface.fill((0, 0, 0))
+        self.terrain.draw_region(self.surface, start_x, start_y, end_x, end_y, camera_x, camera_y)
+        for overlay in self.overlays:
+            overlay.draw_region(self.surface, start_x, start_y, end_x, end_y, camera_x, camera_y)
+        self.surface.set_clip(None)
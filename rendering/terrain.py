@@ -0,0 +1,174 @@
+"""
+🗺️ Terrain Renderer - Ernie's Adventure
+Draws regions of the tile grid onto any surface
+
+This file contains:
+- Tile-by-tile terrain drawing shared by every terrain cache
+- Buildings drawn as one big sprite using the building index
+- An atlas path that blits tiles by integer handle from packed atlas pages
+- Decoration and canopy layers drawn as cut-out sprites over transparency
+- Edge variants for autotiled tiles, picked from precomputed neighbour bitmasks
+- Animated tiles drawn from their frame strip at the current animation frame
+"""
+
+import pygame
+from typing import List, Optional, Tuple
+
+from sprite_manager import SpriteManager
+from buildings import BuildingIndex
+from autotile import AutotileMap, ALL_SIDES
+from tilemap import ANIMATED_TILES
+
+
+class TerrainRenderer:
+    """Draws rectangular regions of the world map onto a target surface"""
+
+    def __init__(self, world_map: List[List[str]], sprite_manager: SpriteManager,
+                 building_index: BuildingIndex, tile_size: int = 32, layer: str = 'ground',
+                 autotile: Optional[AutotileMap] = None):
+        self.world_map = world_map  # tile grid for this renderer's layer
+        self.layer = layer
+        self.sprite_manager = sprite_manager
+        self.building_index = building_index
+        self.tile_size = tile_size
+        self.world_height = len(world_map)
+        self.world_width = len(world_map[0]) if self.world_height > 0 else 0
+        self.handle_map: Optional[List[List[int]]] = None  # atlas handle per tile once enabled
+        self.autotile = autotile  # neighbour bitmasks for edge variants, if any
+        self.animation_frame = 0  # frame of the animated tiles drawn from now on
+
+    def enable_atlas(self) -> None:
+        """Draw tiles from the sprite manager's texture atlas using a per-tile handle grid"""
+        get_tile_handle = self.sprite_manager.get_tile_handle
+        self.handle_map = [[get_tile_handle(tile) for tile in row] for row in self.world_map]
+
+    def update_tile(self, x: int, y: int) -> None:
+        """Refresh per-tile lookups after the world map changed at (x, y)"""
+        if self.handle_map is not None:
+            self.handle_map[y][x] = self.sprite_manager.get_tile_handle(self.world_map[y][x])
+
+    def is_region_empty(self, start_x: int, start_y: int, end_x: int, end_y: int) -> bool:
+        """Check if no tile in [start, end) is drawn on this layer"""
+        for row in self.world_map[max(0, start_y):end_y]:
+            if any(row[max(0, start_x):end_x]):
+                return False
+        return True
+
+    def get_animated_cells(self, start_x: int, start_y: int, end_x: int, end_y: int,
+                           origin_x: int, origin_y: int) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """List (frame strip, position) for every animated tile in [start, end), placed like draw_region"""
+        tile_size = self.tile_size
+        cells = []
+        for y in range(max(0, start_y), min(self.world_height, end_y)):
+            row = self.world_map[y]
+            mask_row = self.autotile.masks[y] if self.autotile is not None else None
+            for x in range(max(0, start_x), min(self.world_width, end_x)):
+                tile = row[x]
+                if tile in ANIMATED_TILES:
+                    mask = mask_row[x] if mask_row is not None else ALL_SIDES
+                    strip = self.sprite_manager.get_animation_strip(tile, self.layer, mask, tile_size)
+                    cells.append((strip, (x * tile_size - origin_x, y * tile_size - origin_y)))
+        return cells
+
+    def draw_region(self, surface: pygame.Surface, start_x: int, start_y: int,
+                    end_x: int, end_y: int, origin_x: int, origin_y: int) -> None:
+        """Draw tiles in [start, end) so that world pixel (origin_x, origin_y) lands at (0, 0)
+
+        Large houses that stick out of the region are clipped to it, so a
+        region can be redrawn on its own without touching its neighbours.
+        """
+        tile_size = self.tile_size
+        start_x = max(0, start_x)
+        start_y = max(0, start_y)
+        end_x = min(self.world_width, end_x)
+        end_y = min(self.world_height, end_y)
+        if start_x >= end_x or start_y >= end_y:
+            return
+
+        # Keep large houses from spilling outside the requested region
+        region_rect = pygame.Rect(start_x * tile_size - origin_x, start_y * tile_size - origin_y,
+                                  (end_x - start_x) * tile_size, (end_y - start_y) * tile_size)
+        previous_clip = surface.get_clip()
+        surface.set_clip(region_rect.clip(previous_clip))
+
+        frame_area = pygame.Rect(self.animation_frame * tile_size, 0, tile_size, tile_size)
+
+        if self.layer != 'ground':
+            # Decoration and canopy layers - cut-out sprites, nothing on empty tiles
+            for y in range(start_y, end_y):
+                row = self.world_map[y]
+                screen_y = y * tile_size - origin_y
+                for x in range(start_x, end_x):
+                    tile = row[x]
+                    if not tile:
+                        continue
+                    if tile in ANIMATED_TILES:
+                        surface.blit(self.sprite_manager.get_animation_strip(tile, self.layer, size=tile_size),
+                                     (x * tile_size - origin_x, screen_y), frame_area)
+                    else:
+                        surface.blit(self.sprite_manager.get_layer_sprite(tile, self.layer, tile_size),
+                                     (x * tile_size - origin_x, screen_y))
+            surface.set_clip(previous_clip)
+            return
+
+        # Keep track of which buildings we've already drawn in this region
+        drawn_buildings = set()
+        atlas_entries = self.sprite_manager.atlas_entries
+        grass_handle = self.sprite_manager.get_tile_handle('.')
+
+        for y in range(start_y, end_y):
+            row = self.world_map[y]
+            handle_row = self.handle_map[y] if self.handle_map is not None else None
+            mask_row = self.autotile.masks[y] if self.autotile is not None else None
+            screen_y = y * tile_size - origin_y
+            for x in range(start_x, end_x):
+                tile = row[x]
+                screen_x = x * tile_size - origin_x
+
+                if tile in ANIMATED_TILES:
+                    # Animated tile - one frame out of the strip for its edge variant
+                    mask = mask_row[x] if mask_row is not None else ALL_SIDES
+                    surface.blit(self.sprite_manager.get_animation_strip(tile, 'ground', mask, tile_size),
+                                 (screen_x, screen_y), frame_area)
+                    continue
+
+                if mask_row is not None and mask_row[x] != ALL_SIDES:
+                    # Edge variant - the bitmask was worked out when the map was built or edited
+                    surface.blit(self.sprite_manager.get_autotile_sprite(tile, mask_row[x], tile_size),
+                                 (screen_x, screen_y))
+                    continue
+
+                if handle_row is not None and tile != 'H':
+                    # Atlas path - an array index and an area blit per tile
+                    page, area = atlas_entries[handle_row[x]]
+                    surface.blit(page, (screen_x, screen_y), area)
+                    continue
+
+                # Special handling for houses - draw each building as one large sprite
+                if tile == 'H':
+                    building = self.building_index.building_at(x, y)
+
+                    if building is not None and building.is_large:
+                        # Skip if this tile belongs to a building we already drew
+                        if building.id in drawn_buildings:
+                            continue
+                        drawn_buildings.add(building.id)
+
+                        building_sprite = self.sprite_manager.get_building_sprite(building.width * tile_size,
+                                                                                  building.height * tile_size)
+                        surface.blit(building_sprite, (building.x * tile_size - origin_x,
+                                                       building.y * tile_size - origin_y))
+                    else:
+                        # A single house tile or a one-tile-wide strip
+                        # Draw grass background first, then small house sprite
+                        if handle_row is not None:
+                            self.sprite_manager.blit_handle(surface, grass_handle, (screen_x, screen_y))
+                            self.sprite_manager.blit_handle(surface, handle_row[x], (screen_x, screen_y))
+                        else:
+                            surface.blit(self.sprite_manager.get_tile_mip('.', tile_size), (screen_x, screen_y))
+                            surface.blit(self.sprite_manager.get_tile_mip('H', tile_size), (screen_x, screen_y))
+                else:
+                    # Regular tile handling
+                    surface.blit(self.sprite_manager.get_tile_mip(tile, tile_size), (screen_x, screen_y))
+
+        surface.set_clip(previous_clip)
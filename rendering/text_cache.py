@@ -0,0 +1,54 @@
+"""
+🔤 Text Cache - Ernie's Adventure
+Reuses rendered text so labels and HUD lines are only rasterized when they change
+
+This file contains:
+- One shared pygame Font per (font name, size)
+- A bounded least-recently-used cache of rendered text surfaces
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+TextKey = Tuple[Optional[str], int, str, Tuple[int, int, int], bool]
+
+
+class TextCache:
+    """Caches fonts and rendered text surfaces keyed by (font, size, text, colour, antialias)"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.surfaces: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, font_name: Optional[str], size: int) -> pygame.font.Font:
+        """Get a font, constructing it only the first time it is asked for"""
+        font = self.fonts.get((font_name, size))
+        if font is None:
+            font = pygame.font.Font(font_name, size)
+            self.fonts[(font_name, size)] = font
+        return font
+
+    def render(self, text: str, size: int, color: Tuple[int, int, int],
+               font_name: Optional[str] = None, antialias: bool = True) -> pygame.Surface:
+        """Get the rendered surface for a piece of text"""
+        key = (font_name, size, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(font_name, size).render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # Drop the least recently used text
+        return surface
+
+    def clear(self) -> None:
+        """Forget all rendered text (fonts are kept)"""
+        self.surfaces.clear()
@@ -0,0 +1,104 @@
+"""
+🎞️ Texture Backend - Ernie's Adventure
+Draws frames with SDL textures through a pygame._sdl2 Renderer
+
+This file contains:
+- A window and renderer that can be forced onto SDL's software renderer
+- Lazy upload of sprites, chunks and text as textures, reused until the surface is gone
+- Re-upload of surfaces marked as changing every frame (minimap, scroll buffer)
+- The same fill/blit/blits/get_clip/get_size calls the draw list uses on a Surface
+"""
+
+import pygame
+import weakref
+from typing import Dict, Iterable, Sequence, Tuple
+
+try:
+    from pygame._sdl2 import video
+    TEXTURES_AVAILABLE = True
+except ImportError:
+    TEXTURES_AVAILABLE = False  # the game warns and falls back to surfaces if textures are asked for
+
+BLENDMODE_MOD = 4  # SDL_BLENDMODE_MOD: colour = source * destination
+
+
+class TextureBackend:
+    """Render target that turns draw list blits into texture draws"""
+
+    def __init__(self, size: Tuple[int, int], title: str, software: bool = False,
+                 window_size: Tuple[int, int] = None, fullscreen: bool = False):
+        if not TEXTURES_AVAILABLE:
+            raise RuntimeError("The texture backend needs pygame._sdl2")
+        self.size = size
+        self.window = video.Window(title, size=window_size or size, fullscreen_desktop=fullscreen)
+        self.renderer = video.Renderer(self.window, accelerated=0 if software else -1)
+        self.renderer.logical_size = size  # SDL scales and letterboxes to the window
+
+        self.textures: Dict[int, Tuple[weakref.ref, "video.Texture"]] = {}
+        self.dynamic = weakref.WeakSet()  # surfaces whose pixels change between frames
+        self.stale = weakref.WeakSet()  # surfaces changed once since their last upload
+        self.uploads = 0  # textures created or refreshed, for measuring
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.size
+
+    def get_clip(self) -> pygame.Rect:
+        return pygame.Rect((0, 0), self.size)
+
+    def fill(self, color: Tuple[int, int, int]) -> None:
+        """Clear the frame to a colour"""
+        self.renderer.draw_color = tuple(color) + (255,)
+        self.renderer.clear()
+
+    def mark_dynamic(self, surface: pygame.Surface) -> None:
+        """Re-upload this surface every time it is drawn because it is redrawn in place"""
+        self.dynamic.add(surface)
+
+    def refresh(self, surface: pygame.Surface) -> None:
+        """Upload this surface again the next time it is drawn because it was changed in place"""
+        self.stale.add(surface)
+
+    def get_texture(self, surface: pygame.Surface) -> "video.Texture":
+        """Get the texture for a surface, uploading it the first time it is drawn"""
+        key = id(surface)
+        entry = self.textures.get(key)
+        if entry is not None and entry[0]() is surface:
+            texture = entry[1]
+            if surface in self.dynamic or surface in self.stale:
+                texture.update(surface)
+                self.stale.discard(surface)
+                self.uploads += 1
+            return texture
+
+        texture = video.Texture.from_surface(self.renderer, surface)
+        self.uploads += 1
+        # Drop the texture as soon as its surface is garbage (replaced chunks, evicted text)
+        self.textures[key] = (weakref.ref(surface, lambda _, key=key: self.textures.pop(key, None)), texture)
+        return texture
+
+    def blits(self, entries: Iterable[Sequence], doreturn: bool = False) -> None:
+        """Draw (surface, dest), (surface, dest, area) or (surface, dest, area, flags) entries like Surface.blits"""
+        for entry in entries:
+            surface, dest = entry[0], entry[1]
+            area = entry[2] if len(entry) > 2 else None
+            texture = self.get_texture(surface)
+            if len(entry) > 3 and entry[3] == pygame.BLEND_RGB_MULT:
+                texture.blend_mode = BLENDMODE_MOD  # lightmaps multiply what is under them
+            if area is None:
+                width, height = surface.get_size()
+                texture.draw(dstrect=(dest[0], dest[1], width, height))
+            else:
+                area = pygame.Rect(area)
+                texture.draw(srcrect=area, dstrect=(dest[0], dest[1], area.width, area.height))
+
+    def blit(self, surface: pygame.Surface, dest: Sequence[int], area: Sequence[int] = None) -> None:
+        """Draw one surface like Surface.blit"""
+        self.blits([(surface, dest, area)])
+
+    def present(self) -> None:
+        """Show the finished frame"""
+        self.renderer.present()
+
+    def to_surface(self) -> pygame.Surface:
+        """Read the current frame back into a Surface (slow - for screenshots and tests)"""
+        return self.renderer.to_surface()
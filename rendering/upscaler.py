@@ -0,0 +1,67 @@
+"""
+🔳 Integer Upscaler - Ernie's Adventure
+Draws the game at its native size and blows it up to fill a bigger display
+
+This file contains:
+- Choosing the largest whole-number scale that fits the display
+- Letterboxing: centring the scaled frame with black bars around it
+- Nearest-neighbour scaling straight into a reused window subsurface
+- Scaling just the dirty rectangles when only part of the frame changed
+"""
+
+import pygame
+from typing import List, Tuple
+
+
+class IntegerUpscaler:
+    """Scales a fixed-size internal frame onto the display by a whole-number factor"""
+
+    def __init__(self, internal_size: Tuple[int, int], display: pygame.Surface, scale: int = 0):
+        self.internal_size = internal_size
+        self.display = display
+        internal_width, internal_height = internal_size
+        display_width, display_height = display.get_size()
+
+        # 0 means the biggest scale that still fits; never go below 1x
+        fit = min(display_width // internal_width, display_height // internal_height)
+        self.scale = max(1, min(scale, fit) if scale > 0 else fit)
+
+        # Centre the scaled frame and keep everything around it black
+        scaled_size = (internal_width * self.scale, internal_height * self.scale)
+        self.frame_rect = pygame.Rect((0, 0), scaled_size)  # may hang off a display smaller than the frame
+        self.frame_rect.center = display.get_rect().center
+        self.dest_rect = self.frame_rect.clip(display.get_rect())
+        self.target = display.subsurface(self.dest_rect)  # reused every frame, never reallocated
+        # Part of the frame cut off at the top left when it is cropped to a small display
+        self.crop = (self.dest_rect.x - self.frame_rect.x, self.dest_rect.y - self.frame_rect.y)
+        self.clear_letterbox()
+
+    def clear_letterbox(self) -> None:
+        """Paint the bars around the scaled frame black"""
+        self.display.fill((0, 0, 0))
+
+    def present(self, frame: pygame.Surface) -> None:
+        """Scale the whole internal frame onto the display"""
+        if self.scale == 1:
+            # Display no bigger than the frame - just centre it (cropped if it doesn't fit)
+            self.target.blit(frame, (0, 0), pygame.Rect(self.crop, self.target.get_size()))
+        else:
+            pygame.transform.scale(frame, self.target.get_size(), self.target)
+
+    def present_rects(self, frame: pygame.Surface, rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Scale just these internal rectangles and return the display rectangles to update"""
+        scale = self.scale
+        frame_rect = frame.get_rect()
+        display_rects = []
+        for rect in rects:
+            rect = rect.clip(frame_rect)
+            if rect.width == 0 or rect.height == 0:
+                continue
+            scaled = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+            if scale == 1:
+                # Blitting at a negative position clips off the cropped part of the rectangle
+                self.target.blit(frame, rect.move(-self.crop[0], -self.crop[1]), rect)
+            else:
+                pygame.transform.scale(frame.subsurface(rect), scaled.size, self.target.subsurface(scaled))
+            display_rects.append(scaled.move(self.frame_rect.topleft).clip(self.dest_rect))
+        return display_rects
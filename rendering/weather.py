@@ -0,0 +1,138 @@
+"""
+🌧️ Weather - Ernie's Adventure
+Rain, snow and falling leaves as NumPy particle systems
+
+This file contains:
+- Particle position, velocity, sway and lifetime kept in preallocated arrays
+- One vectorized update per tick for every particle, with no per-particle Python
+- Pre-rendered particle sprites queued with a single draw list extend
+- Particles that stay put in the world as the camera moves, wrapping around the view
+"""
+
+import pygame
+from typing import Dict, List, Tuple
+
+from .draw_list import DrawList
+
+try:
+    import numpy as np
+    WEATHER_AVAILABLE = True
+except ImportError:
+    WEATHER_AVAILABLE = False  # the game warns and plays without weather if it is asked for
+
+# How each kind of weather moves, per tick in screen pixels
+WEATHER_KINDS: Dict[str, Dict] = {
+    'rain': {
+        'count': 1200,
+        'velocity_x': (-1.5, -1.0),
+        'velocity_y': (9.0, 12.0),
+        'sway': 0.0,            # side-to-side drift amplitude
+        'lifetime': (40, 90),   # ticks before a particle lands and starts again somewhere else
+    },
+    'snow': {
+        'count': 700,
+        'velocity_x': (-0.4, 0.4),
+        'velocity_y': (0.8, 1.6),
+        'sway': 0.6,
+        'lifetime': (200, 400),
+    },
+    'leaves': {
+        'count': 120,
+        'velocity_x': (0.3, 1.2),
+        'velocity_y': (0.6, 1.2),
+        'sway': 1.2,
+        'lifetime': (150, 300),
+    },
+}
+PARTICLE_MARGIN = 8  # particles wrap this far outside the view so none pop in at the edges
+
+
+def create_particle_sprites(kind: str) -> List[pygame.Surface]:
+    """Draw the small sprites a kind of weather picks its particles from"""
+    sprites = []
+    if kind == 'rain':
+        for alpha in (140, 200):
+            streak = pygame.Surface((3, 9), pygame.SRCALPHA)
+            pygame.draw.line(streak, (170, 190, 230, alpha), (2, 0), (0, 8))
+            sprites.append(streak)
+    elif kind == 'snow':
+        for radius in (1, 2):
+            flake = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(flake, (250, 250, 255, 230), (radius, radius), radius)
+            sprites.append(flake)
+    elif kind == 'leaves':
+        for color in ((205, 110, 30), (160, 60, 30), (170, 170, 40)):
+            leaf = pygame.Surface((5, 3), pygame.SRCALPHA)
+            pygame.draw.ellipse(leaf, color + (255,), leaf.get_rect())
+            sprites.append(leaf)
+    else:
+        raise ValueError(f"Unknown weather: {kind}")
+    return sprites
+
+
+class ParticleSystem:
+    """A fixed pool of weather particles updated and drawn in bulk"""
+
+    def __init__(self, kind: str, view_size: Tuple[int, int], seed: int = None):
+        if not WEATHER_AVAILABLE:
+            raise RuntimeError("Weather needs numpy")
+        if kind not in WEATHER_KINDS:
+            raise ValueError(f"Unknown weather: {kind}")
+        settings = WEATHER_KINDS[kind]
+        self.kind = kind
+        self.view_size = view_size
+        self.rng = np.random.default_rng(seed)
+        count = settings['count']
+
+        # Preallocated particle state - respawning only overwrites rows
+        self.position = np.zeros((count, 2), dtype=np.float32)
+        self.velocity = np.zeros((count, 2), dtype=np.float32)
+        self.phase = np.zeros(count, dtype=np.float32)
+        self.lifetime = np.zeros(count, dtype=np.int32)
+        self.sway = settings['sway']
+        self.ticks = 0  # advances every update, so callers can tell the particles moved
+
+        # Each particle keeps one pre-rendered sprite for its whole life
+        self.sprites = create_particle_sprites(kind)
+        self.particle_sprites = [self.sprites[index]
+                                 for index in self.rng.integers(0, len(self.sprites), count)]
+        self._respawn(np.ones(count, dtype=bool))
+
+    def _respawn(self, dead: "np.ndarray") -> None:
+        """Start the given particles again at random places in the view"""
+        settings = WEATHER_KINDS[self.kind]
+        count = int(dead.sum())
+        if count == 0:
+            return
+        width, height = self.view_size
+        self.position[dead, 0] = self.rng.uniform(-PARTICLE_MARGIN, width, count)
+        self.position[dead, 1] = self.rng.uniform(-PARTICLE_MARGIN, height, count)
+        self.velocity[dead, 0] = self.rng.uniform(*settings['velocity_x'], count)
+        self.velocity[dead, 1] = self.rng.uniform(*settings['velocity_y'], count)
+        self.phase[dead] = self.rng.uniform(0, 2 * np.pi, count)
+        self.lifetime[dead] = self.rng.integers(*settings['lifetime'], count)
+
+    def update(self, ticks: int = 1, camera_dx: int = 0, camera_dy: int = 0) -> None:
+        """Move every particle on by some ticks and keep them fixed in the world as the camera moves"""
+        if ticks <= 0 and camera_dx == 0 and camera_dy == 0:
+            return
+        self.ticks += 1
+        position = self.position
+        position += self.velocity * ticks
+        if self.sway:
+            self.phase += 0.05 * ticks
+            position[:, 0] += np.cos(self.phase) * self.sway * ticks
+        position[:, 0] -= camera_dx
+        position[:, 1] -= camera_dy
+
+        # Wrap round the view so the pool always covers the screen
+        width, height = self.view_size
+        position[:, 0] = (position[:, 0] + PARTICLE_MARGIN) % (width + PARTICLE_MARGIN) - PARTICLE_MARGIN
+        position[:, 1] = (position[:, 1] + PARTICLE_MARGIN) % (height + PARTICLE_MARGIN) - PARTICLE_MARGIN
+
+        self.lifetime -= ticks
+        self._respawn(self.lifetime <= 0)
+
+    def submit(self, draw_list: DrawList, layer: str = 'overhead') -> None:
+        """Queue every particle on a draw list as one batch of blits"""
+        draw_list.extend(zip(self.particle_sprites, self.position.astype(np.int32).tolist()), layer)
@@ -0,0 +1,152 @@
+"""
+🗺️ World Map - Ernie's Adventure
+A full-screen map of the whole world, opened and closed with one key
+
+This file contains:
+- One pixel per tile, coloured from a lookup table with a single surfarray call
+- The map scaled once into a framed panel and cached until tiles change
+- Biome labels and NPC markers drawn over it, hidden under the fog of war
+- A marker per player, numbered and in its own colour when there is more than one
+"""
+
+import pygame
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from buildings import BuildingIndex
+from .exploration import ExplorationMap
+from .text_cache import TextCache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # tiles are coloured one at a time instead
+
+Color = Tuple[int, int, int]
+
+PANEL_MARGIN = 40  # screen pixels kept clear around the panel
+PANEL_PADDING = 10
+TITLE_HEIGHT = 30
+
+
+class WorldMapOverlay:
+    """The whole world drawn once, then blitted over the game while the map is open"""
+
+    def __init__(self, world_map: List[List[str]], building_index: BuildingIndex,
+                 colors: Dict[str, Color], default_color: Color, building_color: Color,
+                 marker_colors: Dict[str, Color], labels: Dict[str, Tuple[int, int]],
+                 text_cache: TextCache, screen_size: Tuple[int, int],
+                 exploration: ExplorationMap = None, player_colors: Sequence[Color] = ()):
+        self.world_map = world_map
+        self.building_index = building_index
+        self.colors = colors
+        self.default_color = default_color
+        self.building_color = building_color
+        self.marker_colors = marker_colors  # 'border', 'background', 'player' and 'npc'
+        self.text_cache = text_cache
+        self.exploration = exploration  # hides tiles not seen yet when set
+        self.world_height = len(world_map)
+        self.world_width = len(world_map[0]) if self.world_height > 0 else 0
+
+        # Biggest whole-number scale that fits, so every tile stays a crisp square
+        screen_width, screen_height = screen_size
+        fit = min((screen_width - 2 * (PANEL_MARGIN + PANEL_PADDING)) // max(1, self.world_width),
+                  (screen_height - 2 * (PANEL_MARGIN + PANEL_PADDING) - TITLE_HEIGHT) // max(1, self.world_height))
+        self.scale = max(1, fit)
+        map_size = (self.world_width * self.scale, self.world_height * self.scale)
+
+        self.rect = pygame.Rect(0, 0, map_size[0] + 2 * PANEL_PADDING,
+                                map_size[1] + 2 * PANEL_PADDING + TITLE_HEIGHT)
+        self.rect.center = (screen_width // 2, screen_height // 2)
+        self.map_rect = pygame.Rect((self.rect.x + PANEL_PADDING, self.rect.y + PANEL_PADDING + TITLE_HEIGHT), map_size)
+
+        self.labels = list(labels.items())  # (name, tile the label is centred on)
+        self.npc_marker = pygame.Surface((7, 7), pygame.SRCALPHA)
+        pygame.draw.circle(self.npc_marker, marker_colors['npc'], (3, 3), 3)
+        # Player one uses the 'player' colour, any other players the extra colours in turn
+        player_size = max(4, self.scale)
+        self.player_markers = []
+        for color in (marker_colors['player'],) + tuple(player_colors):
+            marker = pygame.Surface((player_size, player_size))
+            marker.fill(color)
+            self.player_markers.append((marker, color))
+
+        self.panel: Optional[pygame.Surface] = None  # built the first time the map is opened
+
+    def invalidate(self) -> None:
+        """Forget the cached panel because tiles changed - it is rebuilt when next drawn"""
+        self.panel = None
+
+    def render_tiles(self) -> pygame.Surface:
+        """Colour one pixel per tile from the lookup table"""
+        texture = pygame.Surface((self.world_width, self.world_height))
+        if np is None:
+            for y in range(self.world_height):
+                for x in range(self.world_width):
+                    texture.set_at((x, y), self._tile_color(x, y))
+            return texture
+
+        # Tile characters as code points index straight into a colour table
+        lookup = np.empty((256, 3), dtype=np.uint8)
+        lookup[:] = self.default_color
+        for tile, color in self.colors.items():
+            lookup[ord(tile)] = color
+        codes = np.array(self.world_map, dtype='U1').view(np.uint32)
+        pixels = lookup[np.minimum(codes, 255)]
+        for building in self.building_index.buildings.values():
+            pixels[building.y:building.y + building.height, building.x:building.x + building.width] = self.building_color
+        pygame.surfarray.blit_array(texture, pixels.transpose(1, 0, 2))
+        return texture
+
+    def _tile_color(self, x: int, y: int) -> Color:
+        """Choose the map colour for one tile"""
+        if self.building_index.building_at(x, y) is not None:
+            return self.building_color
+        return self.colors.get(self.world_map[y][x], self.default_color)
+
+    def get_panel(self) -> pygame.Surface:
+        """Return the framed, scaled map, building it if the tiles changed since it was last drawn"""
+        if self.panel is None:
+            panel = pygame.Surface(self.rect.size)
+            panel.fill(self.marker_colors['background'])
+            pygame.draw.rect(panel, self.marker_colors['border'], panel.get_rect(), 2)
+            title = self.text_cache.render("World Map", 28, self.marker_colors['border'])
+            panel.blit(title, title.get_rect(midtop=(self.rect.width // 2, PANEL_PADDING)))
+            pygame.transform.scale(self.render_tiles(), self.map_rect.size,
+                                   panel.subsurface((self.map_rect.x - self.rect.x, self.map_rect.y - self.rect.y),
+                                                    self.map_rect.size))
+            self.panel = panel
+        return self.panel
+
+    def _to_screen(self, tile_x: float, tile_y: float) -> Tuple[int, int]:
+        """Screen position of the centre of a tile"""
+        return (self.map_rect.x + int((tile_x + 0.5) * self.scale),
+                self.map_rect.y + int((tile_y + 0.5) * self.scale))
+
+    def _is_visible(self, tile_x: int, tile_y: int) -> bool:
+        """Whether a tile is out of the fog"""
+        return self.exploration is None or self.exploration.is_explored(tile_x, tile_y)
+
+    def draw(self, screen: pygame.Surface, player_tiles: Sequence[Tuple[int, int]],
+             npc_tiles: Iterable[Tuple[int, int]]) -> None:
+        """Blit the cached panel and its fog, then the labels and markers on top"""
+        screen.blit(self.get_panel(), self.rect.topleft)
+        if self.exploration is not None:
+            screen.blit(self.exploration.get_mask(self.scale), self.map_rect.topleft)
+
+        for name, (tile_x, tile_y) in self.labels:
+            if self._is_visible(tile_x, tile_y):
+                label = self.text_cache.render(name, 20, self.marker_colors['border'])
+                shadow = self.text_cache.render(name, 20, self.marker_colors['background'])
+                rect = label.get_rect(center=self._to_screen(tile_x, tile_y))
+                screen.blit(shadow, rect.move(1, 1))
+                screen.blit(label, rect)
+
+        for tile_x, tile_y in npc_tiles:
+            if self._is_visible(tile_x, tile_y):
+                screen.blit(self.npc_marker, self.npc_marker.get_rect(center=self._to_screen(tile_x, tile_y)))
+        for number, player_tile in enumerate(player_tiles, 1):
+            marker, color = self.player_markers[(number - 1) % len(self.player_markers)]
+            rect = screen.blit(marker, marker.get_rect(center=self._to_screen(*player_tile)))
+            if len(player_tiles) > 1:
+                label = self.text_cache.render(str(number), 20, color)
+                screen.blit(label, label.get_rect(midbottom=(rect.centerx, rect.top - 1)))
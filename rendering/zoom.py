@@ -0,0 +1,112 @@
+"""
+🔍 Zoom Levels - Ernie's Adventure
+Terrain renderers and chunk caches for one camera zoom factor
+
+This file contains:
+- The discrete zoom factors the camera can use
+- Per-zoom ground, decoration and canopy chunk caches built from pre-scaled tiles
+- Chunk sizes that grow as the zoom shrinks, so a screen is always a handful of chunks
+- Night lightmaps on the same chunk grid
+"""
+
+from typing import Iterable, Optional, Tuple
+
+from autotile import AutotileMap
+from buildings import BuildingIndex
+from sprite_manager import SpriteManager
+from tilemap import LayeredTilemap
+
+from .chunk_cache import ChunkCache, CHUNK_SIZE
+from .draw_list import DrawList
+from .lighting import LightmapCache, LightSource
+from .scroll_buffer import ScrollingTerrainBuffer
+from .terrain import TerrainRenderer
+
+# Zoom factors, smallest first - each one must give a whole number of pixels per tile
+ZOOM_LEVELS = (0.25, 0.5, 0.75, 1.0, 1.5, 2.0)
+
+
+class ZoomLevel:
+    """Everything needed to draw the tile layers at one zoom factor"""
+
+    def __init__(self, zoom: float, tilemap: LayeredTilemap, sprite_manager: SpriteManager,
+                 building_index: BuildingIndex, base_tile_size: int = 32,
+                 scroll_view_size: Optional[Tuple[int, int]] = None, atlas: bool = False,
+                 autotile: Optional[AutotileMap] = None, lights: Iterable[LightSource] = ()):
+        self.zoom = zoom
+        self.tile_size = int(base_tile_size * zoom)
+
+        # Build this level's tile set once, up front, instead of scaling while drawing
+        if self.tile_size != sprite_manager.tile_size:
+            sprite_manager.prescale_tiles(self.tile_size)
+
+        self.terrain = TerrainRenderer(tilemap.ground, sprite_manager, building_index, self.tile_size,
+                                       autotile=autotile)
+        if atlas:
+            self.terrain.enable_atlas()
+        self.decoration_terrain = TerrainRenderer(tilemap.decoration, sprite_manager, building_index,
+                                                  self.tile_size, layer='decoration')
+        self.canopy_terrain = TerrainRenderer(tilemap.canopy, sprite_manager, building_index,
+                                              self.tile_size, layer='canopy')
+
+        # Keep chunks roughly the same size in pixels at every zoom
+        chunk_size = max(4, int(CHUNK_SIZE / zoom))
+        self.chunk_cache = ChunkCache(self.terrain, chunk_size)
+        self.decoration_cache = ChunkCache(self.decoration_terrain, chunk_size)
+        self.canopy_cache = ChunkCache(self.canopy_terrain, chunk_size)
+        self.lightmaps = LightmapCache(lights, self.terrain.world_width, self.terrain.world_height,
+                                       self.tile_size, chunk_size)
+
+        # Scroll mode shifts last frame's ground and decorations and only draws the newly exposed strips
+        self.scroll_buffer = None
+        if scroll_view_size is not None:
+            self.scroll_buffer = ScrollingTerrainBuffer(self.terrain, scroll_view_size,
+                                                        overlays=[self.decoration_terrain])
+
+    def set_animation_frame(self, frame: int) -> None:
+        """Show this frame of the animated tiles - caches redraw just those tiles when it changes"""
+        self.terrain.animation_frame = frame
+        self.decoration_terrain.animation_frame = frame
+        self.canopy_terrain.animation_frame = frame
+
+    def set_light_step(self, step: int) -> None:
+        """Darken the world to this lighting step - lightmaps are only rebuilt when it changes"""
+        self.lightmaps.set_step(step)
+
+    @property
+    def animating(self) -> bool:
+        """Check if animated tiles were in view when the layers were last queued"""
+        if self.scroll_buffer is not None:
+            return self.scroll_buffer.animating
+        return self.chunk_cache.animating or self.decoration_cache.animating
+
+    def submit(self, draw_list: DrawList, camera_x: int, camera_y: int) -> None:
+        """Queue the ground and decorations under the characters and the canopy over them"""
+        if self.scroll_buffer is not None:
+            self.scroll_buffer.submit(draw_list, camera_x, camera_y)
+        else:
+            self.chunk_cache.submit(draw_list, camera_x, camera_y)
+            self.decoration_cache.submit(draw_list, camera_x, camera_y)
+
+        # Tree tops go over the characters so Ernie can walk under them
+        self.canopy_cache.submit(draw_list, camera_x, camera_y, layer='overhead')
+
+        # Night darkens everything above, but not the HUD
+        self.lightmaps.submit(draw_list, camera_x, camera_y)
+
+    def update_tile(self, x: int, y: int) -> None:
+        """Refresh per-tile lookups after the tile layers changed at (x, y)"""
+        self.terrain.update_tile(x, y)
+
+    def invalidate_area(self, start_x: int, start_y: int, end_x: int, end_y: int,
+                        layers: Iterable[str]) -> None:
+        """Re-render the named layers over the tile area [start, end) when next drawn"""
+        layers = set(layers)
+        if 'ground' in layers:
+            self.chunk_cache.invalidate_area(start_x, start_y, end_x, end_y)
+        if 'decoration' in layers:
+            self.decoration_cache.invalidate_area(start_x, start_y, end_x, end_y)
+        if 'canopy' in layers:
+            self.canopy_cache.invalidate_area(start_x, start_y, end_x, end_y)
+        if self.scroll_buffer is not None and layers & {'ground', 'decoration'}:
+            self.scroll_buffer.invalidate_area(start_x, start_y, end_x, end_y)
@@ -1,8 +1,11 @@
 import pygame
 import os
-from typing import Dict, Optional, Tuple, List
+from typing import Callable, Dict, Optional, Tuple, List
 from enum import Enum
 
+from tilemap import CANOPY_TILES, DECORATION_GROUND, ANIMATED_TILES, ANIMATION_FRAMES
+from autotile import AUTOTILE_TILES, ALL_SIDES, NORTH, EAST, SOUTH, WEST
+
 class SpriteType(Enum):
     """Enum for different sprite types"""
     PLAYER = "player"
@@ -10,6 +13,53 @@ class SpriteType(Enum):
     TILE = "tiles"
     ANIMAL = "animals"
 
+# Sprite name for each tile character
+TILE_MAPPING = {
+    '#': 'wall',
+    'T': 'tree', 
+    'F': 'forest',
+    'W': 'water',
+    'M': 'mountain',
+    'P': 'path',
+    'H': 'house',
+    'R': 'rock',
+    'S': 'stone',
+    'C': 'crops',
+    'B': 'barn',
+    'O': 'well',
+    'D': 'dock',
+    'E': 'cave',
+    'A': 'altar',
+    '.': 'grass'  # Default grass
+}
+
+# Sprites packed into the texture atlas
+ATLAS_NPC_TYPES = ['default', 'farmer', 'merchant', 'wise_man']
+ATLAS_ANIMAL_TYPES = ['cow', 'pig', 'chicken', 'sheep', 'horse', 'goat']
+ATLAS_PLAYER_DIRECTIONS = ['up', 'down', 'left', 'right']
+ATLAS_PAGE_SIZE = 512
+
+# Background colour baked into tile art, removed when a tile is drawn as a decoration
+GRASS_BACKGROUND = (34, 139, 34)
+# Rows of a decoration above this fraction of its height belong to the overhead canopy
+CANOPY_FRACTION = 0.75
+
+# Rim drawn along the sides of an autotiled tile that touch a different tile
+AUTOTILE_EDGE_COLORS = {
+    'W': (194, 178, 128),  # sandy shore
+    'M': (90, 80, 70),     # shadow at the foot of the rock
+    'P': (60, 120, 40),    # grass growing over the edge of the path
+}
+
+# Glints of light on each animation frame of water and the well, (x, y) on a 32x32 tile
+TILE_GLINTS = {
+    'W': [[(6, 9), (19, 24)], [(13, 5), (22, 15)], [(8, 19), (20, 8)], [(5, 14), (15, 22)]],
+    'O': [[(14, 13)], [(16, 15)], [(13, 16)], [(17, 12)]],
+}
+GLINT_COLOR = (220, 235, 255)
+# Crops are darkened in a band that moves down the field like wind through the stalks
+WIND_SHADE = (215, 215, 215)
+
 class SpriteManager:
     """Manages loading, caching, and accessing sprite images"""
     
@@ -18,6 +68,16 @@ class SpriteManager:
         self.sprite_cache: Dict[str, pygame.Surface] = {}
         self.tile_size = 32  # Default tile size
         
+        # Scaled and procedurally built sprites, keyed by (sprite key, size, variant)
+        self.derived_cache: Dict[Tuple[str, Tuple[int, int], str], pygame.Surface] = {}
+        self.derived_hits = 0
+        self.derived_misses = 0
+        
+        # Texture atlas: integer handles index into (atlas page, source rect) entries
+        self.atlas_pages: List[pygame.Surface] = []
+        self.atlas_entries: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        self.atlas_handles: Dict[str, int] = {}
+        
         # Initialize pygame if not already done
         if not pygame.get_init():
             pygame.init()
@@ -121,7 +181,10 @@ class SpriteManager:
         
         if os.path.exists(sprite_path):
             try:
-                sprite = pygame.image.load(sprite_path).convert_alpha()
+                sprite = pygame.image.load(sprite_path)
+                # The texture backend has no display surface to convert to - textures are uploaded as-is
+                if pygame.display.get_surface() is not None:
+                    sprite = sprite.convert_alpha()
                 # Scale to tile size if needed
                 sprite = pygame.transform.scale(sprite, (self.tile_size, self.tile_size))
                 self.sprite_cache[cache_key] = sprite
@@ -139,59 +202,301 @@ class SpriteManager:
         self.sprite_cache[cache_key] = fallback_sprite
         return fallback_sprite
     
+    def get_derived_sprite(self, sprite_key: str, size: Tuple[int, int], variant: str,
+                           build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Get a scaled or generated sprite, building it only the first time it is asked for"""
+        cache_key = (sprite_key, size, variant)
+        sprite = self.derived_cache.get(cache_key)
+        if sprite is not None:
+            self.derived_hits += 1
+            return sprite
+        
+        self.derived_misses += 1
+        sprite = build()
+        self.derived_cache[cache_key] = sprite
+        return sprite
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get hit/miss counts for the derived sprite cache"""
+        return {
+            'entries': len(self.derived_cache),
+            'hits': self.derived_hits,
+            'misses': self.derived_misses
+        }
+    
+    def _get_scaled_sprite(self, sprite_key: str, sprite: pygame.Surface, size: int) -> pygame.Surface:
+        """Get a sprite scaled to size x size, scaling it only once"""
+        return self.get_derived_sprite(sprite_key, (size, size), 'scaled',
+                                       lambda: pygame.transform.scale(sprite, (size, size)))
+    
     def get_player_sprite(self, direction: str = "down", size: int = None) -> pygame.Surface:
         """Get player sprite for specific direction, optionally scaled to custom size"""
         sprite = self.load_sprite(SpriteType.PLAYER, f"player_{direction}")
         
         # If custom size specified, scale the sprite
         if size and size != self.tile_size:
-            sprite = pygame.transform.scale(sprite, (size, size))
+            sprite = self._get_scaled_sprite(f"player_{direction}", sprite, size)
             
         return sprite
     
-    def get_npc_sprite(self, npc_type: str = "default") -> pygame.Surface:
-        """Get NPC sprite by type"""
-        return self.load_sprite(SpriteType.NPC, f"npc_{npc_type}")
+    def get_npc_sprite(self, npc_type: str = "default", size: int = None) -> pygame.Surface:
+        """Get NPC sprite by type, optionally scaled to custom size"""
+        sprite = self.load_sprite(SpriteType.NPC, f"npc_{npc_type}")
+        if size and size != self.tile_size:
+            sprite = self._get_scaled_sprite(f"npc_{npc_type}", sprite, size)
+        return sprite
     
-    def get_animal_sprite(self, animal_type: str) -> pygame.Surface:
-        """Get animal sprite by type"""
-        return self.load_sprite(SpriteType.ANIMAL, f"animal_{animal_type}")
+    def get_animal_sprite(self, animal_type: str, size: int = None) -> pygame.Surface:
+        """Get animal sprite by type, optionally scaled to custom size"""
+        sprite = self.load_sprite(SpriteType.ANIMAL, f"animal_{animal_type}")
+        if size and size != self.tile_size:
+            sprite = self._get_scaled_sprite(f"animal_{animal_type}", sprite, size)
+        return sprite
     
     def get_tile_sprite(self, tile_char: str, size: int = None) -> pygame.Surface:
         """Get tile sprite based on tile character, optionally scaled"""
-        tile_mapping = {
-            '#': 'wall',
-            'T': 'tree', 
-            'F': 'forest',
-            'W': 'water',
-            'M': 'mountain',
-            'P': 'path',
-            'H': 'house',
-            'R': 'rock',
-            'S': 'stone',
-            'C': 'crops',
-            'B': 'barn',
-            'O': 'well',
-            'D': 'dock',
-            'E': 'cave',
-            'A': 'altar',
-            '.': 'grass'  # Default grass
-        }
-        
-        tile_name = tile_mapping.get(tile_char, 'grass')
+        tile_name = TILE_MAPPING.get(tile_char, 'grass')
         
         # Special handling for large houses - use dedicated large house sprite
         if tile_char == 'H' and size and size > self.tile_size:
-            return self._create_large_house_sprite(size)
+            return self.get_derived_sprite('tile_house', (size, size), 'large',
+                                           lambda: self._create_large_house_sprite(size))
         
         sprite = self.load_sprite(SpriteType.TILE, f"tile_{tile_name}")
         
         # If custom size specified, scale the sprite
         if size and size != self.tile_size:
-            sprite = pygame.transform.scale(sprite, (size, size))
+            sprite = self._get_scaled_sprite(f"tile_{tile_name}", sprite, size)
             
         return sprite
     
+    def get_tile_mip(self, tile_char: str, size: int) -> pygame.Surface:
+        """Get a tile sprite scaled to size x size for a zoom level
+        
+        Unlike get_tile_sprite, houses are scaled like any other tile. Smaller
+        sizes are smoothly filtered so zoomed-out terrain doesn't shimmer.
+        """
+        if size == self.tile_size:
+            return self.get_tile_sprite(tile_char)
+        tile_name = TILE_MAPPING.get(tile_char, 'grass')
+        sprite = self.load_sprite(SpriteType.TILE, f"tile_{tile_name}")
+        return self.get_derived_sprite(f"tile_{tile_name}", (size, size), 'mip',
+                                       lambda: self._scale_mip(sprite, size))
+    
+    def prescale_tiles(self, size: int) -> None:
+        """Build the whole tile set at size x size once - one mip level per zoom level"""
+        for tile_char in TILE_MAPPING:
+            self.get_tile_mip(tile_char, size)
+        for tile_char in DECORATION_GROUND:
+            self.get_layer_sprite(tile_char, 'decoration', size)
+            if tile_char in CANOPY_TILES:
+                self.get_layer_sprite(tile_char, 'canopy', size)
+        for tile_char in AUTOTILE_TILES:
+            for mask in range(ALL_SIDES):
+                self.get_autotile_sprite(tile_char, mask, size)
+        for tile_char in ANIMATED_TILES:
+            layer = 'decoration' if tile_char in DECORATION_GROUND else 'ground'
+            masks = range(ALL_SIDES + 1) if tile_char in AUTOTILE_TILES else [ALL_SIDES]
+            for mask in masks:
+                self.get_animation_strip(tile_char, layer, mask, size)
+    
+    def _scale_mip(self, sprite: pygame.Surface, size: int) -> pygame.Surface:
+        """Scale a sprite for a mip level - filtered when shrinking, nearest neighbour when growing"""
+        if size < sprite.get_width() and sprite.get_bitsize() >= 24:
+            return pygame.transform.smoothscale(sprite, (size, size))
+        return pygame.transform.scale(sprite, (size, size))
+    
+    def get_layer_sprite(self, tile_char: str, layer: str, size: int = None) -> pygame.Surface:
+        """Get the part of a tile's sprite drawn on a tilemap layer
+        
+        'ground' is the plain tile sprite. 'decoration' is the sprite with its
+        grass background cut out and, for canopy tiles, without the top part.
+        'canopy' is just that top part.
+        """
+        if layer == 'ground':
+            return self.get_tile_mip(tile_char, size or self.tile_size)
+        tile_name = TILE_MAPPING.get(tile_char, 'grass')
+        sprite = self.get_derived_sprite(f"tile_{tile_name}", (self.tile_size, self.tile_size), layer,
+                                         lambda: self._create_layer_sprite(tile_char, layer))
+        if size and size != self.tile_size:
+            sprite = self.get_derived_sprite(f"tile_{tile_name}", (size, size), layer,
+                                             lambda: self._scale_mip(sprite, size))
+        return sprite
+    
+    def _create_layer_sprite(self, tile_char: str, layer: str) -> pygame.Surface:
+        """Cut the decoration or canopy part out of a tile sprite"""
+        sprite = self.get_tile_sprite(tile_char)
+        width, height = sprite.get_size()
+        layer_sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+        layer_sprite.blit(sprite, (0, 0))
+        
+        # Grass background pixels reachable from the edges are transparent
+        background = pygame.mask.from_threshold(layer_sprite, GRASS_BACKGROUND + (255,), (1, 1, 1, 255))
+        edges = pygame.mask.Mask((width, height), fill=True)
+        edges.erase(pygame.mask.Mask((width - 2, height - 2), fill=True), (1, 1))
+        for region in background.connected_components():
+            if region.overlap(edges, (0, 0)):
+                for y in range(height):
+                    for x in range(width):
+                        if region.get_at((x, y)):
+                            layer_sprite.set_at((x, y), (0, 0, 0, 0))
+        
+        # Split trees and the like into a trunk and an overhead canopy
+        canopy_height = int(height * CANOPY_FRACTION)
+        if layer == 'canopy':
+            layer_sprite.fill((0, 0, 0, 0), (0, canopy_height, width, height - canopy_height))
+        elif tile_char in CANOPY_TILES:
+            layer_sprite.fill((0, 0, 0, 0), (0, 0, width, canopy_height))
+        return layer_sprite
+    
+    def get_autotile_sprite(self, tile_char: str, mask: int, size: int = None) -> pygame.Surface:
+        """Get the edge variant of a tile for a neighbour bitmask from the autotile module
+        
+        ALL_SIDES (or a tile that isn't autotiled) is the plain tile sprite.
+        """
+        if mask == ALL_SIDES or tile_char not in AUTOTILE_EDGE_COLORS:
+            return self.get_tile_mip(tile_char, size or self.tile_size)
+        tile_name = TILE_MAPPING.get(tile_char, 'grass')
+        variant = f"edges_{mask}"
+        sprite = self.get_derived_sprite(f"tile_{tile_name}", (self.tile_size, self.tile_size), variant,
+                                         lambda: self._create_autotile_sprite(tile_char, mask))
+        if size and size != self.tile_size:
+            sprite = self.get_derived_sprite(f"tile_{tile_name}", (size, size), variant,
+                                             lambda: self._scale_mip(sprite, size))
+        return sprite
+    
+    def _create_autotile_sprite(self, tile_char: str, mask: int) -> pygame.Surface:
+        """Draw a rim along every side of a tile whose bit is missing from the mask"""
+        sprite = self.get_tile_sprite(tile_char).copy()
+        width, height = sprite.get_size()
+        edge = max(2, width // 8)
+        color = AUTOTILE_EDGE_COLORS[tile_char]
+        shade = tuple(channel * 3 // 4 for channel in color)
+        open_sides = [bit for bit in (NORTH, EAST, SOUTH, WEST) if not mask & bit]
+        
+        # A darker line just inside each rim, then the rims over it
+        lines = {NORTH: (0, edge, width, 1), EAST: (width - edge - 1, 0, 1, height),
+                 SOUTH: (0, height - edge - 1, width, 1), WEST: (edge, 0, 1, height)}
+        rims = {NORTH: (0, 0, width, edge), EAST: (width - edge, 0, edge, height),
+                SOUTH: (0, height - edge, width, edge), WEST: (0, 0, edge, height)}
+        for bit in open_sides:
+            sprite.fill(shade, lines[bit])
+        for bit in open_sides:
+            sprite.fill(color, rims[bit])
+        
+        # Round off outside corners where two open sides meet
+        notch = edge // 2
+        for vertical, horizontal in ((NORTH, WEST), (NORTH, EAST), (SOUTH, WEST), (SOUTH, EAST)):
+            if vertical in open_sides and horizontal in open_sides:
+                corner_x = 0 if horizontal == WEST else width - notch
+                corner_y = 0 if vertical == NORTH else height - notch
+                sprite.fill(GRASS_BACKGROUND, (corner_x, corner_y, notch, notch))
+        return sprite
+    
+    def get_animation_strip(self, tile_char: str, layer: str = 'ground', mask: int = ALL_SIDES,
+                            size: int = None) -> pygame.Surface:
+        """Get an animated tile's frames side by side in one surface, each size x size
+        
+        Frame n is the area (n * size, 0, size, size). Ground frames start from the
+        autotile variant for the mask, decoration frames from the cut-out sprite.
+        """
+        size = size or self.tile_size
+        tile_name = TILE_MAPPING.get(tile_char, 'grass')
+        return self.get_derived_sprite(f"tile_{tile_name}", (size * ANIMATION_FRAMES, size), f"{layer}_frames_{mask}",
+                                       lambda: self._create_animation_strip(tile_char, layer, mask, size))
+    
+    def _create_animation_strip(self, tile_char: str, layer: str, mask: int, size: int) -> pygame.Surface:
+        """Draw every animation frame at full size and pack them, scaled, into one strip"""
+        if layer == 'ground':
+            base = self.get_autotile_sprite(tile_char, mask)
+            strip = pygame.Surface((size * ANIMATION_FRAMES, size))
+        else:
+            base = self.get_layer_sprite(tile_char, layer)
+            strip = pygame.Surface((size * ANIMATION_FRAMES, size), pygame.SRCALPHA)
+        
+        width, height = base.get_size()
+        for frame in range(ANIMATION_FRAMES):
+            sprite = base.copy()
+            for glint_x, glint_y in TILE_GLINTS.get(tile_char, [[]] * ANIMATION_FRAMES)[frame]:
+                sprite.fill(GLINT_COLOR, (glint_x * width // 32, glint_y * height // 32,
+                                          max(1, 3 * width // 32), max(1, height // 32)))
+            if tile_char == 'C':
+                band_height = height // ANIMATION_FRAMES
+                sprite.fill(WIND_SHADE, (0, frame * band_height, width, band_height),
+                            special_flags=pygame.BLEND_RGB_MULT)
+            if size != width:
+                sprite = self._scale_mip(sprite, size)
+            strip.blit(sprite, (frame * size, 0))
+        return strip
+    
+    def get_building_sprite(self, width: int, height: int) -> pygame.Surface:
+        """Get a large house sprite sized to a building of width x height pixels"""
+        if width == height:
+            return self.get_tile_sprite('H', width)
+        return self.get_derived_sprite('tile_house', (width, height), 'large',
+                                       lambda: self._create_large_house_sprite(width, height))
+    
+    def build_atlas(self, player_size: int = None) -> None:
+        """Pack every tile, NPC, animal and player sprite into a few large atlas pages
+        
+        Each sprite gets an integer handle; atlas_entries[handle] is the
+        (page, source rect) pair to blit from.
+        """
+        sprites: List[Tuple[str, pygame.Surface]] = []
+        for tile_name in dict.fromkeys(TILE_MAPPING.values()):
+            sprites.append((f"tile_{tile_name}", self.load_sprite(SpriteType.TILE, f"tile_{tile_name}")))
+        for npc_type in ATLAS_NPC_TYPES:
+            sprites.append((f"npc_{npc_type}", self.get_npc_sprite(npc_type)))
+        for animal_type in ATLAS_ANIMAL_TYPES:
+            sprites.append((f"animal_{animal_type}", self.get_animal_sprite(animal_type)))
+        for direction in ATLAS_PLAYER_DIRECTIONS:
+            sprites.append((f"player_{direction}", self.get_player_sprite(direction)))
+            if player_size and player_size != self.tile_size:
+                sprites.append((f"player_{direction}@{player_size}", self.get_player_sprite(direction, player_size)))
+        
+        self.atlas_pages = []
+        self.atlas_entries = []
+        self.atlas_handles = {}
+        
+        # Simple shelf packing: tallest sprites first, left to right, new shelf when a row is full
+        page = None
+        shelf_x = shelf_y = shelf_height = 0
+        for name, sprite in sorted(sprites, key=lambda item: -item[1].get_height()):
+            width, height = sprite.get_size()
+            if page is not None and shelf_x + width > ATLAS_PAGE_SIZE:
+                shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height, 0
+            if page is None or shelf_y + height > ATLAS_PAGE_SIZE:
+                page = pygame.Surface((ATLAS_PAGE_SIZE, ATLAS_PAGE_SIZE), pygame.SRCALPHA)
+                self.atlas_pages.append(page)
+                shelf_x = shelf_y = shelf_height = 0
+            
+            page.blit(sprite, (shelf_x, shelf_y))
+            self.atlas_handles[name] = len(self.atlas_entries)
+            self.atlas_entries.append((page, pygame.Rect(shelf_x, shelf_y, width, height)))
+            shelf_x += width
+            shelf_height = max(shelf_height, height)
+    
+    def get_atlas_handle(self, sprite_key: str) -> int:
+        """Get the atlas handle for a sprite key like 'tile_grass', or -1 if it isn't packed"""
+        return self.atlas_handles.get(sprite_key, -1)
+    
+    def get_tile_handle(self, tile_char: str) -> int:
+        """Get the atlas handle for a tile character"""
+        return self.get_atlas_handle(f"tile_{TILE_MAPPING.get(tile_char, 'grass')}")
+    
+    def get_blit_source(self, sprite_key: str,
+                        sprite: pygame.Surface) -> Tuple[pygame.Surface, Optional[pygame.Rect]]:
+        """Get the (surface, area) to blit for a sprite - its atlas region if packed, else the sprite itself"""
+        handle = self.atlas_handles.get(sprite_key, -1)
+        if handle < 0:
+            return sprite, None
+        return self.atlas_entries[handle]
+    
+    def blit_handle(self, target: pygame.Surface, handle: int, dest: Tuple[int, int]) -> None:
+        """Blit a packed sprite by handle"""
+        page, area = self.atlas_entries[handle]
+        target.blit(page, dest, area)
+    
     def preload_common_sprites(self) -> None:
         """Preload commonly used sprites for better performance"""
         # Player sprites
@@ -559,70 +864,65 @@ class SpriteManager:
         
         return sprite
     
-    def _create_large_house_sprite(self, size: int) -> pygame.Surface:
-        """Create a detailed large house sprite for 5x5 tile houses"""
-        sprite = pygame.Surface((size, size))
+    def get_house_windows(self, width: int, height: int) -> List[pygame.Rect]:
+        """Window frames on a large house sprite: lower left, lower right, upper left, upper right"""
+        window_size = min(width, height)//8
+        upper_window_size = min(width, height)//12
+        return [
+            pygame.Rect(width//4, height//2, window_size, window_size),
+            pygame.Rect(width*3//4 - window_size, height//2, window_size, window_size),
+            pygame.Rect(width//3, height//3, upper_window_size, upper_window_size),
+            pygame.Rect(width*2//3, height//3, upper_window_size, upper_window_size)
+        ]
+    
+    def _create_large_house_sprite(self, size: int, height: int = None) -> pygame.Surface:
+        """Create a detailed large house sprite for multi-tile houses (square unless height is given)"""
+        width = size
+        height = height or size
+        sprite = pygame.Surface((width, height))
         sprite.fill((34, 139, 34))  # Grass background
         
-        # Scale factors for the larger house
-        scale = size // 32  # How many times larger than a single tile
-        
         # House walls (light brown/tan) - bigger and more detailed
         wall_color = (210, 180, 140)
-        wall_rect = (size//8, int(size//2.5), size*3//4, int(size//2.5))
+        wall_rect = (width//8, int(height//2.5), width*3//4, int(height//2.5))
         pygame.draw.rect(sprite, wall_color, wall_rect)
         
         # Roof (dark red, triangular) - much larger and more prominent
         roof_color = (139, 69, 19)
-        roof_points = [(size//10, int(size//2.5)), (size//2, size//8), (size*9//10, int(size//2.5))]
+        roof_points = [(width//10, int(height//2.5)), (width//2, height//8), (width*9//10, int(height//2.5))]
         pygame.draw.polygon(sprite, roof_color, roof_points)
         
         # Front door (dark brown) - bigger and more detailed
         door_color = (101, 67, 33)
-        door_width = size//8
-        door_height = size//4
-        door_x = size//2 - door_width//2
-        door_y = size*3//4 - door_height
+        door_width = width//8
+        door_height = height//4
+        door_x = width//2 - door_width//2
+        door_y = height*3//4 - door_height
         door_rect = (door_x, door_y, door_width, door_height)
         pygame.draw.rect(sprite, door_color, door_rect)
         
         # Door handle (yellow) - bigger
-        handle_size = max(2, size//32)
+        handle_size = max(2, min(width, height)//32)
         pygame.draw.circle(sprite, (255, 215, 0), (door_x + door_width*3//4, door_y + door_height//2), handle_size)
         
         # Windows (light blue with white frames) - multiple windows for larger house
         window_frame = (255, 255, 255)
         window_glass = (173, 216, 230)
-        window_size = size//8
-        
-        # Left side windows
-        left_window_x = size//4
-        window_y = size//2
-        pygame.draw.rect(sprite, window_frame, (left_window_x, window_y, window_size, window_size))
-        pygame.draw.rect(sprite, window_glass, (left_window_x + 2, window_y + 2, window_size - 4, window_size - 4))
-        
-        # Right side windows
-        right_window_x = size*3//4 - window_size
-        pygame.draw.rect(sprite, window_frame, (right_window_x, window_y, window_size, window_size))
-        pygame.draw.rect(sprite, window_glass, (right_window_x + 2, window_y + 2, window_size - 4, window_size - 4))
+        lower_left, lower_right, upper_left, upper_right = self.get_house_windows(width, height)
         
-        # Upper windows (in the roof area)
-        upper_window_size = size//12
-        upper_y = size//3
-        
-        # Left upper window
-        pygame.draw.rect(sprite, window_frame, (size//3, upper_y, upper_window_size, upper_window_size))
-        pygame.draw.rect(sprite, window_glass, (size//3 + 1, upper_y + 1, upper_window_size - 2, upper_window_size - 2))
-        
-        # Right upper window
-        pygame.draw.rect(sprite, window_frame, (size*2//3, upper_y, upper_window_size, upper_window_size))
-        pygame.draw.rect(sprite, window_glass, (size*2//3 + 1, upper_y + 1, upper_window_size - 2, upper_window_size - 2))
+        # Lower windows have a wider frame than the small upper windows in the roof area
+        for window in (lower_left, lower_right):
+            pygame.draw.rect(sprite, window_frame, window)
+            pygame.draw.rect(sprite, window_glass, window.inflate(-4, -4))
+        for window in (upper_left, upper_right):
+            pygame.draw.rect(sprite, window_frame, window)
+            pygame.draw.rect(sprite, window_glass, window.inflate(-2, -2))
         
         # Chimney (dark gray) - bigger and more detailed
-        chimney_width = size//8
-        chimney_height = size//4
-        chimney_x = size*3//4
-        chimney_y = size//6
+        chimney_width = width//8
+        chimney_height = height//4
+        chimney_x = width*3//4
+        chimney_y = height//6
         pygame.draw.rect(sprite, (105, 105, 105), (chimney_x, chimney_y, chimney_width, chimney_height))
         
         # Chimney smoke (light gray)
@@ -635,15 +935,11 @@ class SpriteManager:
         # Add some decorative elements for the large house
         # Shutters on windows
         shutter_color = (139, 69, 19)  # Same as roof
-        shutter_width = size//32
-        
-        # Left window shutters
-        pygame.draw.rect(sprite, shutter_color, (left_window_x - shutter_width, window_y, shutter_width, window_size))
-        pygame.draw.rect(sprite, shutter_color, (left_window_x + window_size, window_y, shutter_width, window_size))
+        shutter_width = width//32
         
-        # Right window shutters
-        pygame.draw.rect(sprite, shutter_color, (right_window_x - shutter_width, window_y, shutter_width, window_size))
-        pygame.draw.rect(sprite, shutter_color, (right_window_x + window_size, window_y, shutter_width, window_size))
+        for window in (lower_left, lower_right):
+            pygame.draw.rect(sprite, shutter_color, (window.x - shutter_width, window.y, shutter_width, window.height))
+            pygame.draw.rect(sprite, shutter_color, (window.right, window.y, shutter_width, window.height))
         
         return sprite
     
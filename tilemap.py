@@ -0,0 +1,72 @@
+"""
+🗺️ Layered Tilemap - Ernie's Adventure
+Splits the world map into ground, decoration and canopy layers for drawing
+
+This file contains:
+- Which tiles are decorations and what ground lies beneath them
+- Ground, decoration and overhead canopy grids derived from the world map
+- Per-tile updates when the world map changes
+- Which tiles are animated and how many frames their animation has
+"""
+
+from typing import Dict, List
+
+# Layers in drawing order - the canopy is drawn after the characters
+LAYERS = ('ground', 'decoration', 'canopy')
+
+# Tiles that sit on top of the ground, and the ground tile beneath each one
+DECORATION_GROUND: Dict[str, str] = {
+    'T': '.',  # Trees grow on grass
+    'C': '.',  # Crops are planted in grass fields
+    'D': 'W',  # Docks stand in the water
+}
+
+# Decorations with an overhead part that characters walk under
+CANOPY_TILES = {'T'}
+
+# Tiles drawn from a strip of animation frames instead of a single sprite
+ANIMATED_TILES = {'W', 'C', 'O'}  # water, crops, the well
+ANIMATION_FRAMES = 4  # frames in every animation strip
+
+EMPTY = ''  # No tile on this layer
+
+
+class LayeredTilemap:
+    """Keeps ground, decoration and canopy grids in sync with the world map
+
+    The world map stays the single source of truth for collisions, biomes
+    and the minimap. These grids only decide what is drawn on which layer.
+    """
+
+    def __init__(self, world_map: List[List[str]]):
+        self.world_map = world_map
+        self.world_height = len(world_map)
+        self.world_width = len(world_map[0]) if self.world_height > 0 else 0
+        self.ground: List[List[str]] = [[EMPTY] * self.world_width for _ in range(self.world_height)]
+        self.decoration: List[List[str]] = [[EMPTY] * self.world_width for _ in range(self.world_height)]
+        self.canopy: List[List[str]] = [[EMPTY] * self.world_width for _ in range(self.world_height)]
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Derive every layer from the world map"""
+        for y in range(self.world_height):
+            for x in range(self.world_width):
+                self.update_tile(x, y)
+
+    def update_tile(self, x: int, y: int) -> None:
+        """Re-derive the layers for one tile after the world map changed there"""
+        tile = self.world_map[y][x]
+        ground = DECORATION_GROUND.get(tile)
+        if ground is None:
+            self.ground[y][x] = tile
+            self.decoration[y][x] = EMPTY
+        else:
+            self.ground[y][x] = ground
+            self.decoration[y][x] = tile
+        self.canopy[y][x] = tile if tile in CANOPY_TILES else EMPTY
+
+    def get_layer(self, layer: str) -> List[List[str]]:
+        """Get the tile grid for a layer by name"""
+        if layer not in LAYERS:
+            raise ValueError(f"Unknown tile layer: {layer}")
+        return getattr(self, layer)